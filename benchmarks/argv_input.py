@@ -0,0 +1,107 @@
+"""
+Compares the parsing of ArgvInput, consuming tokens with a cursor, with the
+list.pop(0) based parsing it replaced, on xargs-style invocations with
+many file arguments:
+
+    python benchmarks/argv_input.py
+
+The previous parsing is quadratic, so it is only run up to 100k tokens.
+"""
+
+from __future__ import annotations
+
+import time
+
+from typing import Any
+
+from cleo.io.inputs.argument import Argument
+from cleo.io.inputs.argv_input import ArgvInput
+from cleo.io.inputs.definition import Definition
+from cleo.io.inputs.option import Option
+
+
+class PopArgvInput(ArgvInput):
+    def _parse(self) -> None:
+        parse_options = True
+        self._parsed = self._tokens[:]
+
+        while self._parsed:
+            token = self._parsed.pop(0)
+            if parse_options and token == "":
+                self._parse_argument(token)
+            elif parse_options and token == "--":
+                parse_options = False
+            elif parse_options and token.startswith("--"):
+                self._parse_long_option(token)
+            elif parse_options and token.startswith("-") and token != "-":
+                self._parse_short_option(token)
+            else:
+                self._parse_argument(token)
+
+    def _add_long_option(self, name: str, value: Any) -> None:
+        option = self._definition.option(name)
+        if value is None and option.accepts_value() and self._parsed:
+            next_token = self._parsed.pop(0)
+            if not next_token.startswith("-") or next_token == "":
+                value = next_token
+            else:
+                self._parsed.insert(0, next_token)
+
+        # Keeps the cursor based parsing from looking for another value
+        self._cursor = len(self._parsed)
+        super()._add_long_option(name, value)
+
+
+def definition() -> Definition:
+    return Definition(
+        [
+            Argument("command", required=True),
+            Argument("files", is_list=True),
+            Option("--exclude", "-e", flag=False, is_list=True),
+            Option("--verbose", "-v", flag=True),
+        ]
+    )
+
+
+def argv(size: int) -> list[str]:
+    tokens = ["console", "check", "-v"]
+    for i in range(size - 2):
+        if i % 100 == 0:
+            tokens.extend(["--exclude", f"build/{i}"])
+        else:
+            tokens.append(f"src/module_{i}.py")
+
+    return tokens[: size + 1]
+
+
+def parse(cls: type[ArgvInput], tokens: list[str]) -> tuple[float, ArgvInput]:
+    input = cls(tokens)
+    start = time.perf_counter()
+    input.bind(definition())
+
+    return time.perf_counter() - start, input
+
+
+def main() -> None:
+    print(f"{'tokens':>9}  {'list.pop(0)':>12}  {'cursor':>12}  {'speedup':>8}")
+    for size in (1_000, 10_000, 100_000, 1_000_000):
+        tokens = argv(size)
+        after, input = parse(ArgvInput, tokens)
+
+        if size > 100_000:
+            print(f"{size:>9}  {'-':>12}  {after * 1e3:>10.1f}ms  {'-':>8}")
+
+            continue
+
+        before, pop_input = parse(PopArgvInput, tokens)
+        assert pop_input.arguments == input.arguments
+        assert pop_input.options == input.options
+
+        print(
+            f"{size:>9}  {before * 1e3:>10.1f}ms"
+            f"  {after * 1e3:>10.1f}ms  {before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
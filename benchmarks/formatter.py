@@ -0,0 +1,73 @@
+"""
+Measures how Formatter.format_and_wrap() scales with the message size.
+
+The time spent per byte should stay roughly constant across sizes,
+with and without wrapping:
+
+    python benchmarks/formatter.py
+    python benchmarks/formatter.py --max-size 1MB --decorated
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from cleo.formatters.formatter import Formatter
+
+
+UNIT = (
+    "Lorem <info>ipsum</info> dolor <error>sit</error> amet, "
+    "<fg=cyan;options=bold>consectetur</> adipiscing \\<elit>.\n"
+)
+
+SIZES = {
+    "1KB": 1_000,
+    "10KB": 10_000,
+    "100KB": 100_000,
+    "1MB": 1_000_000,
+    "10MB": 10_000_000,
+    "50MB": 50_000_000,
+}
+
+
+def build_message(size: int) -> str:
+    return (UNIT * (size // len(UNIT) + 1))[:size]
+
+
+def measure(formatter: Formatter, message: str, width: int) -> float:
+    repeat = max(1, 1_000_000 // len(message))
+    best = float("inf")
+    for _ in range(3 if repeat == 1 else 1):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            formatter.format_and_wrap(message, width)
+        best = min(best, (time.perf_counter() - start) / repeat)
+
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-size", default="50MB", choices=list(SIZES))
+    parser.add_argument("--width", type=int, default=80)
+    parser.add_argument("--decorated", action="store_true")
+    args = parser.parse_args()
+
+    formatter = Formatter(decorated=args.decorated)
+
+    print(f"{'size':>6}  {'mode':<9}  {'seconds':>10}  {'ns/byte':>8}")
+    for name, size in SIZES.items():
+        message = build_message(size)
+        for mode, width in (("unwrapped", 0), ("wrapped", args.width)):
+            elapsed = measure(formatter, message, width)
+            print(
+                f"{name:>6}  {mode:<9}  {elapsed:>10.4f}  {elapsed / size * 1e9:>8.1f}"
+            )
+
+        if name == args.max_size:
+            break
+
+
+if __name__ == "__main__":
+    main()
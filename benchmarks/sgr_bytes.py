@@ -0,0 +1,67 @@
+"""
+Compares the number of bytes written for typical decorated output,
+with full and with minimal escape sequences:
+
+    python benchmarks/sgr_bytes.py
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from cleo.io.outputs.buffered_output import BufferedOutput
+from cleo.ui.exception_trace.component import ExceptionTrace
+from cleo.ui.table import Table
+
+
+BOOKS = [
+    ["99921-58-10-7", "Divine Comedy", "Dante Alighieri"],
+    ["9971-5-0210-0", "A Tale of Two Cities", "Charles Dickens"],
+    ["960-425-059-0", "The Lord of the Rings", "J. R. R. Tolkien"],
+    ["80-902734-1-6", "And Then There Were None", "Agatha Christie"],
+    ["9782070409341", "Le Père Goriot", "Honoré de Balzac"],
+]
+
+
+def render_table(output: BufferedOutput) -> None:
+    table = Table(output, style="box")
+    table.set_header_title("Books")
+    table.set_headers(["ISBN", "Title", "Author"])
+    table.set_rows([[f"<comment>{isbn}</>", *rest] for isbn, *rest in BOOKS])
+    table.render()
+
+
+def render_exception_trace(output: BufferedOutput) -> None:
+    def fail(depth: int) -> None:
+        if depth:
+            fail(depth - 1)
+
+        raise ValueError("Something went wrong")
+
+    try:
+        fail(5)
+    except ValueError as e:
+        ExceptionTrace(e).render(output)
+
+
+def measure(render: Callable[[BufferedOutput], None], minimal_sgr: bool) -> int:
+    output = BufferedOutput(decorated=True)
+    output.formatter.minimal_sgr(minimal_sgr)
+    render(output)
+
+    return len(output.fetch().encode())
+
+
+def main() -> None:
+    print(f"{'output':<16}  {'full':>8}  {'minimal':>8}  {'saved':>6}")
+    for name, render in (
+        ("table", render_table),
+        ("exception trace", render_exception_trace),
+    ):
+        full = measure(render, False)
+        minimal = measure(render, True)
+        print(f"{name:<16}  {full:>8}  {minimal:>8}  {1 - minimal / full:>6.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compares cleo._utils.strip_tags() with the HTMLParser based implementation
+it replaced, on tag-dense and tag-free input:
+
+    python benchmarks/strip_tags.py
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from functools import partial
+from html.parser import HTMLParser
+
+from cleo._utils import strip_tags
+
+
+class TagStripper(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=False)
+
+        self.reset()
+        self.fed: list[str] = []
+
+    def handle_data(self, d: str) -> None:
+        self.fed.append(d)
+
+    def handle_entityref(self, name: str) -> None:
+        self.fed.append(f"&{name};")
+
+    def handle_charref(self, name: str) -> None:
+        self.fed.append(f"&#{name};")
+
+    def get_data(self) -> str:
+        return "".join(self.fed)
+
+
+def _strip(value: str) -> str:
+    s = TagStripper()
+    s.feed(value)
+    s.close()
+
+    return s.get_data()
+
+
+def html_parser_strip_tags(value: str) -> str:
+    while "<" in value and ">" in value:
+        new_value = _strip(value)
+        if value.count("<") == new_value.count("<"):
+            break
+
+        value = new_value
+
+    return value
+
+
+INPUTS = {
+    "tag-dense": "<info>foo</info> <error>bar</> <fg=red;options=bold>baz</> " * 20,
+    "tag-free": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20,
+    "short": "<comment>Generating autoload files</comment>",
+}
+
+
+def main() -> None:
+    print(f"{'input':<10}  {'html.parser':>12}  {'strip_tags':>12}  {'speedup':>8}")
+    for name, value in INPUTS.items():
+        assert strip_tags(value) == html_parser_strip_tags(value)
+
+        number = 2000
+        before = timeit.timeit(partial(html_parser_strip_tags, value), number=number)
+        after = timeit.timeit(partial(strip_tags, value), number=number)
+        print(
+            f"{name:<10}  {before / number * 1e6:>10.1f}us"
+            f"  {after / number * 1e6:>10.1f}us  {before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,50 +1,70 @@
 from __future__ import annotations
 
 import math
+import re
+import unicodedata
 
 from dataclasses import dataclass
-from html.parser import HTMLParser
+from functools import lru_cache
 
 from rapidfuzz.distance import Levenshtein
 
 
-class TagStripper(HTMLParser):
-    def __init__(self) -> None:
-        super().__init__(convert_charrefs=False)
+# The tags understood by the Formatter
+TAG_REGEX = re.compile(r"(?ix)<(([a-z](?:[^<>]*)) | /([a-z](?:[^<>]*))?)>")
 
-        self.reset()
-        self.fed: list[str] = []
 
-    def handle_data(self, d: str) -> None:
-        self.fed.append(d)
+def strip_tags(value: str) -> str:
+    """
+    Removes the tags, as understood by the Formatter, from the given text.
+    """
+    if "<" not in value:
+        return value
 
-    def handle_entityref(self, name: str) -> None:
-        self.fed.append(f"&{name};")
+    return TAG_REGEX.sub("", value)
 
-    def handle_charref(self, name: str) -> None:
-        self.fed.append(f"&#{name};")
 
-    def get_data(self) -> str:
-        return "".join(self.fed)
+def display_width(text: str) -> int:
+    """
+    Returns the number of terminal columns the given text occupies.
 
+    Wide East Asian characters, including most emojis, take two columns
+    while combining marks and other zero-width characters take none.
+    """
+    if text.isascii():
+        return len(text)
 
-def _strip(value: str) -> str:
-    s = TagStripper()
-    s.feed(value)
-    s.close()
+    if len(text) > 256:
+        return sum(map(char_width, text))
 
-    return s.get_data()
+    return _display_width(text)
 
 
-def strip_tags(value: str) -> str:
-    while "<" in value and ">" in value:
-        new_value = _strip(value)
-        if value.count("<") == new_value.count("<"):
-            break
+@lru_cache(maxsize=1024)
+def _display_width(text: str) -> int:
+    return sum(map(char_width, text))
+
+
+@lru_cache(maxsize=4096)
+def char_width(char: str) -> int:
+    """
+    Returns the number of terminal columns the given character occupies.
+    """
+    if char.isascii():
+        return 1
+
+    if (
+        unicodedata.combining(char)
+        or unicodedata.category(char) in {"Mn", "Me", "Cf"}
+        # Hangul Jamo medial vowels and final consonants
+        or "\u1160" <= char <= "\u11ff"
+    ):
+        return 0
 
-        value = new_value
+    if unicodedata.east_asian_width(char) in {"W", "F"}:
+        return 2
 
-    return value
+    return 1
 
 
 def find_similar_names(name: str, names: list[str]) -> list[str]:
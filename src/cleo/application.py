@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import os
 import re
 import sys
@@ -29,7 +30,7 @@ from cleo.io.inputs.option import Option
 from cleo.io.io import IO
 from cleo.io.outputs.output import Verbosity
 from cleo.io.outputs.stream_output import StreamOutput
-from cleo.terminal import Terminal
+from cleo.terminal import TerminalGeometry
 from cleo.ui.ui import UI
 
 
@@ -37,6 +38,7 @@ if TYPE_CHECKING:
     from cleo.commands.command import Command
     from cleo.events.event_dispatcher import EventDispatcher
     from cleo.io.inputs.input import Input
+    from cleo.io.log_handler import LogHandler
     from cleo.io.outputs.output import Output
     from cleo.loaders.command_loader import CommandLoader
 
@@ -57,7 +59,7 @@ class Application:
         self._name = name
         self._version = version
         self._display_name: str | None = None
-        self._terminal = Terminal().size
+        self._terminal = TerminalGeometry.shared()
         self._default_command = "list"
         self._single_command = False
         self._commands: dict[str, Command] = {}
@@ -68,6 +70,11 @@ class Application:
         self._auto_exit = True
         self._initialized = False
         self._ui: UI | None = None
+        self._log_handler: LogHandler | None = None
+        self._loggers: list[logging.Logger] = []
+        self._use_root_logger = False
+        # The level of the root logger while it is lowered by run()
+        self._root_logger_level: int | None = None
 
         # TODO: signals support
         self._event_dispatcher: EventDispatcher | None = None
@@ -120,6 +127,37 @@ class Application:
     def help(self) -> str:
         return self.long_version
 
+    @property
+    def log_handler(self) -> LogHandler | None:
+        return self._log_handler
+
+    def use_logging(self, logger: logging.Logger | None = None) -> LogHandler:
+        """
+        Writes the records of the given logger, the root logger by default,
+        to the error output of the application.
+
+        The verbosity of the application sets the level of the handler:
+        warnings are written by default, info records with -v
+        and debug records with -vvv.
+
+        The level of a given logger is lowered if it would filter out records
+        the handler writes, but never raised. The level of the root logger is
+        only lowered while the application runs, and restored afterwards.
+        """
+        from cleo.io.log_handler import LogHandler
+
+        if self._log_handler is None:
+            self._log_handler = LogHandler()
+
+        if logger is None:
+            logging.getLogger().addHandler(self._log_handler)
+            self._use_root_logger = True
+        elif logger not in self._loggers:
+            logger.addHandler(self._log_handler)
+            self._loggers.append(logger)
+
+        return self._log_handler
+
     @property
     def ui(self) -> UI:
         if self._ui is None:
@@ -308,9 +346,9 @@ class Application:
         try:
             io = self.create_io(input, output, error_output)
 
-            self._configure_io(io)
-
             try:
+                self._configure_io(io)
+
                 exit_code = self._run(io)
             except BrokenPipeError:
                 # If we are piped to another process, it may close early and send a
@@ -326,6 +364,11 @@ class Application:
 
                 exit_code = 1
                 # TODO: Custom error exit codes
+            finally:
+                # Async outputs left open would leave their stream non-blocking
+                io.detach_async_outputs()
+                self._flush_io(io)
+                self._restore_root_logger_level()
         except KeyboardInterrupt:
             exit_code = 1
 
@@ -334,6 +377,24 @@ class Application:
 
         return exit_code
 
+    def _flush_io(self, io: IO) -> None:
+        """
+        Flushes what the outputs may still buffer.
+        """
+        if self._log_handler is not None:
+            with suppress(BrokenPipeError):
+                self._log_handler.flush()
+
+        for output in (io.output, io.error_output):
+            # The other end of a pipe may have been closed already
+            with suppress(BrokenPipeError):
+                output.flush()
+
+    def _restore_root_logger_level(self) -> None:
+        if self._root_logger_level is not None:
+            logging.getLogger().setLevel(self._root_logger_level)
+            self._root_logger_level = None
+
     def _run(self, io: IO) -> int:
         if io.input.has_parameter_option(["--version", "-V"], True):
             io.write_line(self.long_version)
@@ -480,8 +541,16 @@ class Application:
         return IO(input, output, error_output)
 
     def render_error(self, error: Exception, io: IO) -> None:
+        from cleo.io.outputs.json_lines_output import JsonLinesOutput
         from cleo.ui.exception_trace.component import ExceptionTrace
 
+        if isinstance(io.error_output, JsonLinesOutput):
+            io.error_output.emit(
+                {"type": "error", "error": type(error).__name__, "message": str(error)}
+            )
+
+            return
+
         trace = ExceptionTrace(error)
         simple = not io.is_verbose() or isinstance(error, CleoUserError)
         trace.render(io.error_output, simple)
@@ -530,6 +599,29 @@ class Application:
         if shell_verbosity == -1:
             io.interactive(False)
 
+        output_format = io.input.parameter_option("--output-format", "text", True)
+        if output_format not in ("text", "jsonl"):
+            raise CleoUserError(
+                f'Invalid output format "{output_format}", expected one of: text, jsonl'
+            )
+
+        if output_format == "jsonl":
+            io.use_json_lines()
+
+        if self._log_handler is not None:
+            self._log_handler.set_output(io.error_output)
+            self._log_handler.set_verbosity(io.error_output.verbosity)
+            for logger in self._loggers:
+                if logger.getEffectiveLevel() > self._log_handler.level:
+                    logger.setLevel(self._log_handler.level)
+
+            root = logging.getLogger()
+            if self._use_root_logger and root.level > self._log_handler.level:
+                self._root_logger_level = root.level
+                root.setLevel(self._log_handler.level)
+
+            self._log_handler.start()
+
     @property
     def _default_definition(self) -> Definition:
         return Definition(
@@ -570,6 +662,12 @@ class Application:
                 ),
                 Option("--ansi", flag=True, description="Force ANSI output."),
                 Option("--no-ansi", flag=True, description="Disable ANSI output."),
+                Option(
+                    "--output-format",
+                    flag=False,
+                    default="text",
+                    description="The format of the output (text or jsonl).",
+                ),
                 Option(
                     "--no-interaction",
                     "-n",
@@ -2,12 +2,70 @@ from __future__ import annotations
 
 import os
 
+from enum import Enum
+from functools import lru_cache
 from typing import ClassVar
+from typing import Sequence
 
 from cleo.exceptions import CleoValueError
 
 
+class ColorDepth(Enum):
+    """
+    The number of colors a terminal can display.
+    """
+
+    ANSI_16 = 16
+    ANSI_256 = 256
+    TRUECOLOR = 16_777_216
+
+    @classmethod
+    def from_environment(cls) -> ColorDepth:
+        """
+        Detects the color depth of the terminal from the environment variables.
+        """
+        if os.getenv("COLORTERM") in ("truecolor", "24bit"):
+            return cls.TRUECOLOR
+
+        if "256color" in os.getenv("TERM", ""):
+            return cls.ANSI_256
+
+        return cls.ANSI_16
+
+
+# Levels of each channel of the 6x6x6 color cube of the 256 colors palette
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+_CUBE_INDEXES = [
+    min(range(6), key=lambda i: abs(_CUBE_LEVELS[i] - value)) for value in range(256)
+]
+
+
+@lru_cache(maxsize=1024)
+def _rgb_to_ansi_256(r: int, g: int, b: int) -> int:
+    """
+    Returns the closest color of the 256 colors palette,
+    either from its color cube or from its grayscale ramp.
+    """
+    ri, gi, bi = _CUBE_INDEXES[r], _CUBE_INDEXES[g], _CUBE_INDEXES[b]
+    cube = (_CUBE_LEVELS[ri], _CUBE_LEVELS[gi], _CUBE_LEVELS[bi])
+
+    gray_index = min(23, max(0, round(((r + g + b) / 3 - 8) / 10)))
+    gray = 8 + gray_index * 10
+
+    cube_distance = sum((c - v) ** 2 for c, v in zip(cube, (r, g, b)))
+    gray_distance = sum((gray - v) ** 2 for v in (r, g, b))
+    if gray_distance < cube_distance:
+        return 232 + gray_index
+
+    return 16 + 36 * ri + 6 * gi + bi
+
+
 class Color:
+    """
+    An immutable combination of colors and options,
+    whose escape sequences are computed once.
+    """
+
     COLORS: ClassVar[dict[str, tuple[int, int]]] = {
         "black": (30, 40),
         "red": (31, 41),
@@ -38,12 +96,25 @@ class Color:
         "conceal": {"set": 8, "unset": 28},
     }
 
+    _interned: ClassVar[
+        dict[tuple[str, str, tuple[str, ...], ColorDepth | None], Color]
+    ] = {}
+
     def __init__(
         self,
         foreground: str = "",
         background: str = "",
         options: list[str] | None = None,
+        depth: ColorDepth | None = None,
     ) -> None:
+        """
+        Hexadecimal colors are degraded to the given color depth,
+        which is detected from the environment if not given.
+        """
+        if depth is None and (foreground[:1] == "#" or background[:1] == "#"):
+            depth = ColorDepth.from_environment()
+
+        self._depth = depth
         self._foreground = self._parse_color(foreground, False)
         self._background = self._parse_color(background, True)
 
@@ -57,10 +128,101 @@ class Color:
 
             self._options[option] = self.AVAILABLE_OPTIONS[option]
 
+        self._set_sequence = self._build_set_sequence()
+        self._unset_sequence = self._build_unset_sequence()
+        self._transitions: dict[Color, str] = {}
+
+    @classmethod
+    def intern(
+        cls,
+        foreground: str = "",
+        background: str = "",
+        options: Sequence[str] = (),
+        depth: ColorDepth | None = None,
+    ) -> Color:
+        """
+        Returns a shared Color for the given specification,
+        creating it on first use.
+        """
+        # Only hexadecimal colors depend on the color depth
+        if foreground[:1] == "#" or background[:1] == "#":
+            depth = depth or ColorDepth.from_environment()
+        else:
+            depth = None
+
+        options = tuple(options)
+        key = (foreground, background, options, depth)
+
+        color = cls._interned.get(key)
+        if color is None:
+            # Keep a single instance if several threads create the same color
+            color = cls._interned.setdefault(
+                key, cls(foreground, background, list(options), depth)
+            )
+
+        return color
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Color):
+            return NotImplemented
+
+        return (self._set_sequence, self._unset_sequence) == (
+            other._set_sequence,
+            other._unset_sequence,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._set_sequence, self._unset_sequence))
+
     def apply(self, text: str) -> str:
-        return self.set() + text + self.unset()
+        return f"{self._set_sequence}{text}{self._unset_sequence}"
 
     def set(self) -> str:
+        return self._set_sequence
+
+    def unset(self) -> str:
+        return self._unset_sequence
+
+    def transition(self, target: Color) -> str:
+        """
+        Returns the shortest escape sequence changing the attributes
+        set by this color into the ones of the target color.
+        """
+        sequence = self._transitions.get(target)
+        if sequence is None:
+            sequence = self._transitions[target] = self._build_transition(target)
+
+        return sequence
+
+    def _build_transition(self, target: Color) -> str:
+        codes = []
+
+        if target._foreground != self._foreground:
+            codes.append(target._foreground or "39")
+
+        if target._background != self._background:
+            codes.append(target._background or "49")
+
+        # Some options share their unset code (bold and dark),
+        # so the ones to keep might have to be set again.
+        unset_codes = {
+            option["unset"]
+            for name, option in self._options.items()
+            if name not in target._options
+        }
+        codes.extend(str(code) for code in sorted(unset_codes))
+        codes.extend(
+            str(option["set"])
+            for name, option in target._options.items()
+            if name not in self._options or option["unset"] in unset_codes
+        )
+
+        if not codes:
+            return ""
+
+        return f"\033[{';'.join(codes)}m"
+
+    def _build_set_sequence(self) -> str:
         codes = []
 
         if self._foreground:
@@ -76,7 +238,7 @@ class Color:
 
         return f"\033[{';'.join(codes)}m"
 
-    def unset(self) -> str:
+    def _build_unset_sequence(self) -> str:
         codes = []
 
         if self._foreground:
@@ -122,10 +284,13 @@ class Color:
         g = (color >> 8) & 255
         b = color & 255
 
-        if os.getenv("COLORTERM") != "truecolor":
-            return str(self._degrade_hex_color_to_ansi(r, g, b))
+        if self._depth is ColorDepth.TRUECOLOR:
+            return f"8;2;{r};{g};{b}"
+
+        if self._depth is ColorDepth.ANSI_256:
+            return f"8;5;{_rgb_to_ansi_256(r, g, b)}"
 
-        return f"8;2;{r};{g};{b}"
+        return str(self._degrade_hex_color_to_ansi(r, g, b))
 
     def _degrade_hex_color_to_ansi(self, r: int, g: int, b: int) -> int:
         if round(self._get_saturation(r, g, b) / 50) == 0:
@@ -13,11 +13,13 @@ from cleo.formatters.style import Style
 from cleo.io.inputs.definition import Definition
 from cleo.io.inputs.string_input import StringInput
 from cleo.io.null_io import NullIO
+from cleo.io.outputs.json_lines_output import JsonLinesOutput
 from cleo.io.outputs.output import Verbosity
 from cleo.ui.table_separator import TableSeparator
 
 
 if TYPE_CHECKING:
+    from typing import Callable
     from typing import Literal
 
     from cleo.application import Application
@@ -333,26 +335,51 @@ class Command:
 
     def line(
         self,
-        text: str,
+        text: str | Callable[[], str],
         style: str | None = None,
         verbosity: Verbosity = Verbosity.NORMAL,
     ) -> None:
         """
         Write a string as information output.
+
+        The string may be given as a function returning it,
+        only called if the verbosity of the output is high enough.
         """
+        if not self._io.output.is_enabled(verbosity):
+            return
+
+        if callable(text):
+            text = text()
+
+        if isinstance(self._io.output, JsonLinesOutput):
+            self._io.output.emit_line(text, style=style, verbosity=verbosity)
+
+            return
+
         styled = f"<{style}>{text}</>" if style else text
 
         self._io.write_line(styled, verbosity=verbosity)
 
     def line_error(
         self,
-        text: str,
+        text: str | Callable[[], str],
         style: str | None = None,
         verbosity: Verbosity = Verbosity.NORMAL,
     ) -> None:
         """
         Write a string as information output to stderr.
         """
+        if not self._io.error_output.is_enabled(verbosity):
+            return
+
+        if callable(text):
+            text = text()
+
+        if isinstance(self._io.error_output, JsonLinesOutput):
+            self._io.error_output.emit_line(text, style=style, verbosity=verbosity)
+
+            return
+
         styled = f"<{style}>{text}</>" if style else text
 
         self._io.write_error_line(styled, verbosity)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+
+from collections import OrderedDict
+from typing import Generic
+from typing import Hashable
+from typing import NamedTuple
+from typing import TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    max_size: int
+    size: int
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A bounded mapping discarding the least recently used entries first.
+
+    It can be shared between threads.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._max_size,
+                len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
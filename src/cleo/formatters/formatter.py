@@ -2,23 +2,60 @@ from __future__ import annotations
 
 import re
 
+from functools import lru_cache
 from typing import ClassVar
 
+from cleo._utils import TAG_REGEX
+from cleo._utils import char_width
+from cleo._utils import display_width
+from cleo.color import Color
+from cleo.color import ColorDepth
 from cleo.exceptions import CleoValueError
+from cleo.formatters.cache import CacheInfo
+from cleo.formatters.cache import LRUCache
 from cleo.formatters.style import Style
 from cleo.formatters.style_stack import StyleStack
+from cleo.formatters.template import CompiledTemplate
+
+
+_NEW_LINE_REGEX = re.compile(r"(\n)$")
+_ESCAPE_SEQUENCE_REGEX = re.compile(r"\033\[[^m]*m")
+
+# The style of text outside of tags, shared by the messages being formatted
+_EMPTY_STYLE = Style()
 
 
 class Formatter:
-    TAG_REGEX = re.compile(r"(?ix)<(([a-z](?:[^<>]*)) | /([a-z](?:[^<>]*))?)>")
+    TAG_REGEX = TAG_REGEX
 
     _inline_styles_cache: ClassVar[dict[str, Style]] = {}
 
+    # Longer texts are not worth keeping around for remove_format()
+    VISIBLE_TEXT_CACHE_MAX_LENGTH = 1024
+
+    # Longer messages are not kept in the formatted messages cache
+    CACHE_MAX_LENGTH = 1024
+
+    # When streaming, a "<" not followed by ">" within that many characters
+    # is not considered as the start of a tag anymore.
+    STREAM_MAX_TAG_LENGTH = 256
+
     def __init__(
-        self, decorated: bool = False, styles: dict[str, Style] | None = None
+        self,
+        decorated: bool = False,
+        styles: dict[str, Style] | None = None,
+        cache_size: int = 0,
     ) -> None:
         self._decorated = decorated
+        self._minimal_sgr = False
+        self._color_depth: ColorDepth | None = None
         self._styles: dict[str, Style] = {}
+        self._styles_version = 0
+        # The sum of the versions of the registered styles
+        self._style_versions = 0
+        self._cache: LRUCache[tuple[str, bool, bool, int, int], str] | None = None
+        self.set_cache_size(cache_size)
+        self._visible_text_cache: LRUCache[str, str] = LRUCache(256)
 
         self.set_style("error", Style("red", options=["bold"]))
         self.set_style("info", Style("blue"))
@@ -31,7 +68,9 @@ class Formatter:
         for name, style in (styles or {}).items():
             self.set_style(name, style)
 
-        self._style_stack = StyleStack()
+        # Only streamed messages keep their styles from one call to the next
+        self._stream_style_stack = StyleStack(_EMPTY_STYLE)
+        self._stream_buffer = ""
 
     @classmethod
     def escape(cls, text: str) -> str:
@@ -59,8 +98,49 @@ class Formatter:
     def is_decorated(self) -> bool:
         return self._decorated
 
+    def minimal_sgr(self, minimal_sgr: bool = True) -> None:
+        """
+        Sets whether decorated output only contains the escape sequences
+        changing the attributes from one styled segment to the next,
+        instead of fully setting and resetting the style of each segment.
+        """
+        self._minimal_sgr = minimal_sgr
+
+    def is_minimal_sgr(self) -> bool:
+        return self._minimal_sgr
+
+    @property
+    def color_depth(self) -> ColorDepth | None:
+        return self._color_depth
+
+    def set_color_depth(self, depth: ColorDepth | None) -> None:
+        """
+        Sets the color depth hexadecimal colors are degraded to.
+
+        If None, it is detected from the environment.
+        """
+        self._color_depth = depth
+
+        for style in self._styles.values():
+            style.color_for(depth)
+
+        self._styles_changed()
+
+    @property
+    def styles_version(self) -> int:
+        """
+        A number incremented every time the registered styles change.
+        """
+        self._check_styles()
+
+        return self._styles_version
+
     def set_style(self, name: str, style: Style) -> None:
+        # Resolve the color once rather than when formatting
+        style.color_for(self._color_depth)
+
         self._styles[name] = style
+        self._styles_changed()
 
     def has_style(self, name: str) -> bool:
         return name in self._styles
@@ -74,25 +154,66 @@ class Formatter:
     def format(self, message: str) -> str:
         return self.format_and_wrap(message, 0)
 
+    def set_cache_size(self, size: int) -> None:
+        """
+        Sets the maximum number of formatted messages kept in memory
+        to be returned again when formatting the same message.
+
+        A size of 0 disables the cache.
+        """
+        self._cache = LRUCache(size) if size > 0 else None
+
+    def cache_info(self) -> CacheInfo | None:
+        """
+        Returns the statistics of the formatted messages cache, if enabled.
+        """
+        if self._cache is None:
+            return None
+
+        return self._cache.info()
+
     def format_and_wrap(self, message: str, width: int) -> str:
+        if self._cache is None or len(message) > self.CACHE_MAX_LENGTH:
+            return self._format_and_wrap(message, width, StyleStack(_EMPTY_STYLE))
+
+        self._check_styles()
+        key = (
+            message,
+            self._decorated,
+            self._minimal_sgr,
+            width,
+            self._styles_version,
+        )
+        output = self._cache.get(key)
+        if output is None:
+            output = self._format_and_wrap(message, width, StyleStack(_EMPTY_STYLE))
+            self._cache.set(key, output)
+
+        return output
+
+    def _format_and_wrap(
+        self, message: str, width: int, style_stack: StyleStack
+    ) -> str:
+        if not (width or self._decorated):
+            return self._format_plain(message, style_stack)
+
+        output = _FormattedMessage(self._decorated, self._minimal_sgr)
         offset = 0
-        output = ""
         current_line_length = 0
         for match in self.TAG_REGEX.finditer(message):
             pos = match.start()
-            text = match.group(0)
 
             if pos != 0 and message[pos - 1] == "\\":
                 continue
 
             # add the text up to the next tag
-            formatted, current_line_length = self._apply_current_style(
-                message[offset:pos], output, width, current_line_length
+            current_line_length = self._apply_current_style(
+                message[offset:pos], style_stack, output, width, current_line_length
             )
-            output += formatted
-            offset = pos + len(text)
+            offset = match.end()
 
             # Opening tag
+            text = match.group(0)
             seen_open = text[1] != "/"
             tag = match.group(1) if seen_open else match.group(2)
 
@@ -102,32 +223,154 @@ class Formatter:
 
             if not (seen_open or tag):
                 # </>
-                self._style_stack.pop()
+                style_stack.pop()
             elif style is None:
-                formatted, current_line_length = self._apply_current_style(
-                    text, output, width, current_line_length
+                current_line_length = self._apply_current_style(
+                    text, style_stack, output, width, current_line_length
                 )
-                output += formatted
             elif seen_open:
-                self._style_stack.push(style)
+                style_stack.push(style)
             else:
-                self._style_stack.pop(style)
+                style_stack.pop(style)
+
+        self._apply_current_style(
+            message[offset:], style_stack, output, width, current_line_length
+        )
+
+        return output.getvalue().replace("\0", "\\").replace("\\<", "<")
+
+    def feed(self, chunk: str) -> str:
+        """
+        Formats a chunk of a message streamed in several parts.
+
+        The end of the chunk is held back if it may be the start of a tag
+        or of an escape sequence, and is formatted along with the next chunk.
+        Styles of tags left open apply to the next chunks.
+        Call close() once the whole message has been fed.
+
+        Unlike format(), a formatter streams a single message at a time.
+        """
+        data = self._stream_buffer + chunk
+
+        end = data.rfind("<")
+        if (
+            end == -1
+            or ">" in data[end:]
+            or len(data) - end > self.STREAM_MAX_TAG_LENGTH
+        ):
+            end = len(data)
+
+        # A backslash escapes the next "<", possibly from the next chunk
+        while end and data[end - 1] == "\\":
+            end -= 1
+
+        self._stream_buffer = data[end:]
+        if not end:
+            return ""
+
+        return self._format_and_wrap(data[:end], 0, self._stream_style_stack)
+
+    def close(self) -> str:
+        """
+        Formats what is left of a streamed message and ends the stream.
+        """
+        data = self._stream_buffer
+        self._stream_buffer = ""
 
-        formatted, current_line_length = self._apply_current_style(
-            message[offset:], output, width, current_line_length
+        output = (
+            self._format_and_wrap(data, 0, self._stream_style_stack) if data else ""
         )
-        output += formatted
-        return output.replace("\0", "\\").replace("\\<", "<")
+        self._stream_style_stack.reset()
+
+        return output
+
+    def compile(self, template: str) -> CompiledTemplate:
+        """
+        Compiles a markup template with str.format() replacement fields
+        so that it can be rendered repeatedly without being parsed again.
+        """
+        return CompiledTemplate(self, template)
 
     def remove_format(self, text: str) -> str:
-        decorated = self._decorated
+        """
+        Returns the text as it is displayed,
+        without tags nor ANSI escape sequences.
+        """
+        visible_text = self._visible_text_cache.get(text)
+        if visible_text is not None:
+            return visible_text
 
-        self._decorated = False
-        text = re.sub(r"\033\[[^m]*m", "", self.format(text))
+        visible_text = self._format_plain(text, StyleStack(_EMPTY_STYLE))
+        if "\033" in visible_text:
+            visible_text = _ESCAPE_SEQUENCE_REGEX.sub("", visible_text)
 
-        self._decorated = decorated
+        if len(text) <= self.VISIBLE_TEXT_CACHE_MAX_LENGTH:
+            self._visible_text_cache.set(text, visible_text)
 
-        return text
+        return visible_text
+
+    def visible_width(self, text: str) -> int:
+        """
+        Returns the width of the text as it is displayed.
+        """
+        return display_width(self.remove_format(text))
+
+    def _format_plain(self, message: str, style_stack: StyleStack) -> str:
+        """
+        Formats a message without decoration nor wrapping.
+
+        Tags are only checked for validity, no style is applied.
+        """
+        segments: list[str] = []
+        offset = 0
+        for match in self.TAG_REGEX.finditer(message):
+            pos = match.start()
+
+            if pos != 0 and message[pos - 1] == "\\":
+                continue
+
+            segments.append(message[offset:pos])
+            offset = match.end()
+
+            text = match.group(0)
+            seen_open = text[1] != "/"
+            tag = match.group(1) if seen_open else match.group(2)
+
+            style = None
+            if tag:
+                style = self._create_style_from_string(tag)
+
+            if not (seen_open or tag):
+                style_stack.pop()
+            elif style is None:
+                segments.append(text)
+            elif seen_open:
+                style_stack.push(style)
+            else:
+                style_stack.pop(style)
+
+        segments.append(message[offset:])
+
+        return "".join(segments).replace("\0", "\\").replace("\\<", "<")
+
+    def _check_styles(self) -> None:
+        """
+        Drops what was formatted with the registered styles
+        if a style was modified since.
+        """
+        if self._style_versions != self._sum_style_versions():
+            self._styles_changed()
+
+    def _styles_changed(self) -> None:
+        self._style_versions = self._sum_style_versions()
+        self._styles_version += 1
+        self._visible_text_cache.clear()
+
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _sum_style_versions(self) -> int:
+        return sum(style.version for style in self._styles.values())
 
     def _create_style_from_string(self, string: str) -> Style | None:
         if string in self._styles:
@@ -154,47 +397,199 @@ class Formatter:
                 except ValueError:
                     return None
 
-        self._inline_styles_cache[string] = style
-
-        return style
+        # Concurrent calls may build the same style, only one of them is kept
+        return self._inline_styles_cache.setdefault(string, style)
 
     def _apply_current_style(
-        self, text: str, current: str, width: int, current_line_length: int
-    ) -> tuple[str, int]:
+        self,
+        text: str,
+        style_stack: StyleStack,
+        output: _FormattedMessage,
+        width: int,
+        current_line_length: int,
+    ) -> int:
+        """
+        Appends the given text, styled with the current style
+        and optionally wrapped, to the formatted output.
+
+        Returns the width of the current output line.
+        """
         if not text:
-            return "", current_line_length
+            return current_line_length
+
+        color = style_stack.current.color_for(self._color_depth)
 
         if not width:
-            if self.is_decorated():
-                return self._style_stack.current.apply(text), current_line_length
+            output.append(color, text)
 
-            return text, current_line_length
+            return current_line_length
 
-        if not current_line_length and current:
+        if not current_line_length and output:
             text = text.lstrip()
 
+        is_ascii = text.isascii()
+
         if current_line_length:
             i = width - current_line_length
+            if not is_ascii:
+                i = _fitting_length(text, i)
             prefix = text[:i] + "\n"
             text = text[i:]
         else:
             prefix = ""
 
-        m = re.match(r"(\n)$", text)
-        text = prefix + re.sub(rf"([^\n]{{{width}}})\ *", "\\1\n", text)
+        m = _NEW_LINE_REGEX.match(text)
+        if is_ascii:
+            text = prefix + _wrap_regex(width).sub("\\1\n", text)
+        else:
+            text = prefix + _wrap_wide(text, width)
         text = text.rstrip("\n") + (m.group(1) if m else "")
 
-        if not current_line_length and current and not current.endswith("\n"):
+        if not current_line_length and output and not output.ends_with_new_line():
             text = "\n" + text
 
         lines = text.split("\n")
-        for line in lines:
-            current_line_length += len(line)
-            if current_line_length >= width:
-                current_line_length = 0
+        if len(lines) > 1:
+            current_line_length = 0
+
+        current_line_length += display_width(lines[-1])
+        if current_line_length >= width:
+            current_line_length = 0
+
+        output.append_lines(color, lines)
+
+        return current_line_length
+
+
+class _FormattedMessage:
+    """
+    Collects the styled segments of a message being formatted.
+    """
+
+    _NO_COLOR = Color.intern()
+
+    def __init__(self, decorated: bool, minimal_sgr: bool) -> None:
+        self._segments: list[str] = []
+        self._decorated = decorated
+        self._minimal_sgr = decorated and minimal_sgr
+        self._color = self._NO_COLOR
+        # Wrapping decisions are based on the fully styled output,
+        # so that minimal escape sequences never change the layout.
+        self._is_empty = True
+        self._ends_with_new_line = False
+
+    def __bool__(self) -> bool:
+        return not self._is_empty
+
+    def ends_with_new_line(self) -> bool:
+        return self._ends_with_new_line
+
+    def append(self, color: Color, text: str) -> None:
+        self._segments.append(self._style(color, text) if self._decorated else text)
+        self._is_empty = False
+        self._ends_with_new_line = text.endswith("\n") and not (
+            self._decorated and color.unset()
+        )
+
+    def append_lines(self, color: Color, lines: list[str]) -> None:
+        if self._minimal_sgr:
+            # Like fully styled lines, wrapped lines do not carry
+            # their attributes over to the next line.
+            *head, last = lines
+            text = "".join(
+                [f"{self._style(color, line)}{self._reset()}\n" for line in head]
+            )
+            text += self._style(color, last)
+        elif self._decorated:
+            text = "\n".join([color.apply(line) for line in lines])
+        else:
+            text = "\n".join(lines)
+
+        if text:
+            self._segments.append(text)
+
+        if len(lines) > 1 or lines[0] or (self._decorated and color.set()):
+            self._is_empty = False
+            self._ends_with_new_line = (
+                len(lines) > 1
+                and not lines[-1]
+                and not (self._decorated and color.unset())
+            )
+
+    def getvalue(self) -> str:
+        if self._minimal_sgr:
+            self._segments.append(self._reset())
+
+        return "".join(self._segments)
+
+    def _style(self, color: Color, text: str) -> str:
+        if not self._minimal_sgr:
+            return color.apply(text)
+
+        transition = self._color.transition(color)
+        self._color = color
+
+        return f"{transition}{text}"
+
+    def _reset(self) -> str:
+        transition = self._color.transition(self._NO_COLOR)
+        self._color = self._NO_COLOR
+
+        return transition
+
+
+@lru_cache(maxsize=32)
+def _wrap_regex(width: int) -> re.Pattern[str]:
+    return re.compile(rf"([^\n]{{{width}}})\ *")
+
+
+def _fitting_length(text: str, width: int) -> int:
+    """
+    Returns the number of leading characters of the text
+    fitting in the given number of columns.
+    """
+    for i, char in enumerate(text):
+        width -= char_width(char)
+        if width < 0:
+            return i
+
+    return len(text)
+
+
+def _wrap_wide(text: str, width: int) -> str:
+    """
+    Inserts a new line every time a line reaches the given number
+    of columns, dropping the spaces following it.
+
+    This is the equivalent of the wrapping regex for text
+    containing characters that are not one column wide.
+    """
+    wrapped = []
+    line_width = 0
+    i = 0
+    length = len(text)
+    while i < length:
+        char = text[i]
+        if char == "\n":
+            wrapped.append(char)
+            line_width = 0
+            i += 1
+
+            continue
+
+        char_columns = char_width(char)
+        if line_width and line_width + char_columns > width:
+            # The character does not fit on the current line
+            line_width = width
+        else:
+            wrapped.append(char)
+            line_width += char_columns
+            i += 1
 
-        if self.is_decorated():
-            apply = self._style_stack.current.apply
-            text = "\n".join(map(apply, lines))
+        if line_width >= width:
+            wrapped.append("\n")
+            line_width = 0
+            while i < length and text[i] == " ":
+                i += 1
 
-        return text, current_line_length
+    return "".join(wrapped)
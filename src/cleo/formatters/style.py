@@ -1,9 +1,17 @@
 from __future__ import annotations
 
 from cleo.color import Color
+from cleo.color import ColorDepth
 
 
 class Style:
+    """
+    A style applied to text enclosed in tags.
+
+    Modifying a style replaces its color rather than altering it,
+    since colors are shared between styles.
+    """
+
     def __init__(
         self,
         foreground: str | None = None,
@@ -12,19 +20,52 @@ class Style:
     ) -> None:
         self._foreground = foreground or ""
         self._background = background or ""
-        self._options = options or []
-
-        self._color = Color(self._foreground, self._background, self._options)
+        self._options = list(options or [])
+
+        self._color = Color.intern(self._foreground, self._background, self._options)
+        # Colors of the style for given color depths, resolved on first use
+        self._colors: dict[ColorDepth, Color] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        A number incremented every time the style is modified.
+        """
+        return self._version
+
+    @property
+    def color(self) -> Color:
+        return self._color
+
+    def color_for(self, depth: ColorDepth | None) -> Color:
+        """
+        Returns the color of the style for the given color depth.
+        """
+        if depth is None:
+            return self._color
+
+        color = self._colors.get(depth)
+        if color is None:
+            color = self._colors[depth] = Color.intern(
+                self._foreground, self._background, self._options, depth
+            )
+
+        return color
 
     def foreground(self, foreground: str) -> Style:
-        self._color = Color(foreground, self._background, self._options)
+        self._color = Color.intern(foreground, self._background, self._options)
+        self._colors = {}
         self._foreground = foreground
+        self._version += 1
 
         return self
 
     def background(self, background: str) -> Style:
-        self._color = Color(self._foreground, background, self._options)
+        self._color = Color.intern(self._foreground, background, self._options)
+        self._colors = {}
         self._background = background
+        self._version += 1
 
         return self
 
@@ -51,14 +92,14 @@ class Style:
 
     def set_option(self, option: str) -> Style:
         self._options.append(option)
-        self._color = Color(self._foreground, self._background, self._options)
+        self._update_color()
         return self
 
     def unset_option(self, option: str) -> Style:
         if option in self._options:
             index = self._options.index(option)
             del self._options[index]
-            self._color = Color(self._foreground, self._background, self._options)
+            self._update_color()
         return self
 
     def _toggle_option(self, toggle_flag: bool, option: str) -> Style:
@@ -66,3 +107,8 @@ class Style:
 
     def apply(self, text: str) -> str:
         return self._color.apply(text)
+
+    def _update_color(self) -> None:
+        self._color = Color.intern(self._foreground, self._background, self._options)
+        self._colors = {}
+        self._version += 1
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import string
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from cleo.exceptions import CleoValueError
+
+
+if TYPE_CHECKING:
+    from cleo.formatters.formatter import Formatter
+
+
+class CompiledTemplate:
+    """
+    A markup template whose tags are parsed and styles resolved only once.
+
+    Replacement fields use the str.format() syntax. The values given
+    when rendering are inserted as plain text into the prebuilt output,
+    they are never interpreted as markup.
+    """
+
+    # Stands for a replacement field while the template is being formatted.
+    PLACEHOLDER = "\ue000"
+
+    _field_formatter = string.Formatter()
+
+    def __init__(self, formatter: Formatter, template: str) -> None:
+        self._formatter = formatter
+        self._template = template
+        self._fields: list[tuple[str, str | None, str]] = []
+
+        markup = []
+        auto_index = 0
+        for literal, field_name, format_spec, conversion in self._field_formatter.parse(
+            template
+        ):
+            markup.append(literal)
+
+            if field_name is None:
+                continue
+
+            if not field_name or field_name[0] in ".[":
+                field_name = f"{auto_index}{field_name}"
+                auto_index += 1
+
+            self._fields.append((field_name, conversion, format_spec or ""))
+            markup.append(self.PLACEHOLDER)
+
+        self._markup = "".join(markup)
+        self._segments: dict[tuple[bool, bool, int], list[str]] = {}
+
+    @property
+    def template(self) -> str:
+        return self._template
+
+    def render(self, *args: Any, **kwargs: Any) -> str:
+        segments = self._get_segments()
+        parts = [segments[0]]
+
+        for (field_name, conversion, format_spec), segment in zip(
+            self._fields, segments[1:]
+        ):
+            value, _ = self._field_formatter.get_field(field_name, args, kwargs)
+            if conversion:
+                value = self._field_formatter.convert_field(value, conversion)
+
+            parts.append(format(value, format_spec))
+            parts.append(segment)
+
+        return "".join(parts)
+
+    def _get_segments(self) -> list[str]:
+        key = (
+            self._formatter.is_decorated(),
+            self._formatter.is_minimal_sgr(),
+            self._formatter.styles_version,
+        )
+
+        segments = self._segments.get(key)
+        if segments is None:
+            segments = self._formatter.format(self._markup).split(self.PLACEHOLDER)
+            if len(segments) != len(self._fields) + 1:
+                raise CleoValueError(
+                    f'Invalid template "{self._template}":'
+                    " replacement fields are not allowed inside tags"
+                )
+
+            self._segments = {
+                k: v for k, v in self._segments.items() if k[-1] == key[-1]
+            }
+            self._segments[key] = segments
+
+        return segments
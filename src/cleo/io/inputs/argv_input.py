@@ -25,16 +25,13 @@ class ArgvInput(Input):
         if argv is None:
             argv = sys.argv
 
-        argv = argv[:]
-
         # Strip the application name
-        try:
-            self._script_name: str | None = argv.pop(0)
-        except IndexError:
-            self._script_name = None
+        self._script_name: str | None = argv[0] if argv else None
 
-        self._tokens = argv
+        self._tokens = argv[1:]
         self._parsed: list[str] = []
+        # The position of the next token to parse in _parsed
+        self._cursor = 0
 
         super().__init__(definition=definition)
 
@@ -111,18 +108,14 @@ class ArgvInput(Input):
         if not isinstance(values, list):
             values = [values]
 
-        tokens = self._tokens[:]
-        while tokens:
-            token = tokens.pop(0)
+        tokens = self._tokens
+        for i, token in enumerate(tokens):
             if only_params and token == "--":
                 return default
 
             for value in values:
                 if token == value:
-                    try:
-                        return tokens.pop(0)
-                    except IndexError:
-                        return None
+                    return tokens[i + 1] if i + 1 < len(tokens) else None
 
                 # Options with values:
                 # For long options, test for '--option=' at beginning
@@ -130,23 +123,24 @@ class ArgvInput(Input):
                 leading = value + "=" if value.startswith("--") else value
 
                 if token == value or leading != "" and token.startswith(leading):
-                    return token[len(leading)]
+                    return token[len(leading) :]
 
-        return False
+        return default
 
     def _set_tokens(self, tokens: list[str]) -> None:
         self._tokens = tokens
 
     def _parse(self) -> None:
         parse_options = True
-        self._parsed = self._tokens[:]
+        # Tokens are consumed by moving the cursor,
+        # so that parsing takes linear time
+        self._parsed = self._tokens
+        self._cursor = 0
 
-        try:
-            token = self._parsed.pop(0)
-        except IndexError:
-            return
+        while self._cursor < len(self._parsed):
+            token = self._parsed[self._cursor]
+            self._cursor += 1
 
-        while token is not None:
             if parse_options and token == "":
                 self._parse_argument(token)
             elif parse_options and token == "--":
@@ -158,11 +152,6 @@ class ArgvInput(Input):
             else:
                 self._parse_argument(token)
 
-            try:
-                token = self._parsed.pop(0)
-            except IndexError:
-                return
-
     def _parse_short_option(self, token: str) -> None:
         name = token[1:]
 
@@ -201,11 +190,8 @@ class ArgvInput(Input):
 
         pos = name.find("=")
         if pos != -1:
-            value = name[pos + 1 :]
-            if not value:
-                self._parsed.insert(0, value)
-
-            self._add_long_option(name[:pos], value)
+            # An empty value given with "=" is not followed by another one
+            self._add_long_option(name[:pos], name[pos + 1 :])
         else:
             self._add_long_option(name, None)
 
@@ -269,14 +255,17 @@ class ArgvInput(Input):
         if not (value is None or option.accepts_value()):
             raise CleoRuntimeError(f'The "--{name}" option does not accept a value')
 
-        if value in ("", None) and option.accepts_value() and self._parsed:
+        if (
+            value is None
+            and option.accepts_value()
+            and self._cursor < len(self._parsed)
+        ):
             # If the option accepts a value, either required or optional,
             # we check if there is one
-            next_token = self._parsed.pop(0)
-            if not next_token.startswith("-") or next_token in ("", None):
+            next_token = self._parsed[self._cursor]
+            if not next_token.startswith("-") or next_token == "":
                 value = next_token
-            else:
-                self._parsed.insert(0, next_token)
+                self._cursor += 1
 
         if value is None:
             if option.requires_value():
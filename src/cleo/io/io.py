@@ -8,7 +8,10 @@ from cleo.io.outputs.output import Verbosity
 
 
 if TYPE_CHECKING:
+    from cleo.formatters.template import CompiledTemplate
     from cleo.io.inputs.input import Input
+    from cleo.io.outputs.async_output import AsyncOutput
+    from cleo.io.outputs.output import Messages
     from cleo.io.outputs.output import Output
     from cleo.io.outputs.section_output import SectionOutput
 
@@ -18,6 +21,8 @@ class IO:
         self._input = input
         self._output = output
         self._error_output = error_output
+        self._async_output: AsyncOutput | None = None
+        self._async_error_output: AsyncOutput | None = None
 
     @property
     def input(self) -> Input:
@@ -31,21 +36,65 @@ class IO:
     def error_output(self) -> Output:
         return self._error_output
 
+    def async_output(self) -> AsyncOutput:
+        """
+        Returns the output to use from coroutines,
+        writing without blocking the running event loop.
+        """
+        from cleo.io.outputs.async_output import AsyncOutput
+
+        if self._async_output is None:
+            self._async_output = AsyncOutput(self._output)
+
+        return self._async_output
+
+    def async_error_output(self) -> AsyncOutput:
+        """
+        Returns the error output to use from coroutines,
+        writing without blocking the running event loop.
+        """
+        from cleo.io.outputs.async_output import AsyncOutput
+
+        if self._async_error_output is None:
+            self._async_error_output = AsyncOutput(self._error_output)
+
+        return self._async_error_output
+
+    def detach_async_outputs(self) -> None:
+        """
+        Detaches the outputs returned by async_output()
+        and async_error_output(), if any.
+
+        They should be closed by the coroutines using them instead,
+        so that what they did not write yet is not dropped.
+        """
+        for output in (self._async_output, self._async_error_output):
+            if output is not None:
+                output.detach()
+
+        self._async_output = None
+        self._async_error_output = None
+
     def read(self, length: int, default: str = "") -> str:
         """
         Reads the given amount of characters from the input stream.
         """
+        # Make sure what was written, like a question, is displayed first
+        self.flush()
+
         return self._input.read(length, default=default)
 
     def read_line(self, length: int = -1, default: str = "") -> str:
         """
         Reads a line from the input stream.
         """
+        self.flush()
+
         return self._input.read_line(length=length, default=default)
 
     def write_line(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: OutputType = OutputType.NORMAL,
     ) -> None:
@@ -53,7 +102,7 @@ class IO:
 
     def write(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         new_line: bool = False,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: OutputType = OutputType.NORMAL,
@@ -62,7 +111,7 @@ class IO:
 
     def write_error_line(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: OutputType = OutputType.NORMAL,
     ) -> None:
@@ -70,7 +119,7 @@ class IO:
 
     def write_error(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         new_line: bool = False,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: OutputType = OutputType.NORMAL,
@@ -97,6 +146,7 @@ class IO:
 
     def flush(self) -> None:
         self._output.flush()
+        self._error_output.flush()
 
     def is_interactive(self) -> bool:
         return self._input.is_interactive()
@@ -111,6 +161,28 @@ class IO:
     def is_decorated(self) -> bool:
         return self._output.is_decorated()
 
+    def use_json_lines(self) -> None:
+        """
+        Makes the outputs write JSON Lines records instead of formatted text.
+        """
+        from cleo.io.outputs.json_lines_output import JsonLinesOutput
+
+        if not isinstance(self._output, JsonLinesOutput):
+            self._output = JsonLinesOutput(self._output)
+
+        if not isinstance(self._error_output, JsonLinesOutput):
+            self._error_output = JsonLinesOutput(self._error_output)
+
+        self.detach_async_outputs()
+
+    def is_json_lines(self) -> bool:
+        """
+        Returns whether the outputs write JSON Lines records.
+        """
+        from cleo.io.outputs.json_lines_output import JsonLinesOutput
+
+        return isinstance(self._output, JsonLinesOutput)
+
     def supports_utf8(self) -> bool:
         return self._output.supports_utf8()
 
@@ -136,5 +208,11 @@ class IO:
     def remove_format(self, text: str) -> str:
         return self._output.remove_format(text)
 
+    def visible_width(self, text: str) -> int:
+        return self._output.visible_width(text)
+
+    def compile(self, template: str) -> CompiledTemplate:
+        return self._output.compile(template)
+
     def section(self) -> SectionOutput:
         return self._output.section()
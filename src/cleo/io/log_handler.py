@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import copy
+import logging
+import queue
+
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+from typing import TYPE_CHECKING
+from typing import ClassVar
+
+from cleo.formatters.formatter import Formatter
+from cleo.io.outputs.output import Verbosity
+
+
+if TYPE_CHECKING:
+    from cleo.io.outputs.output import Output
+
+
+class LogHandler(QueueHandler):
+    """
+    Writes log records to an output, styled by level,
+    with the verbosity matching their level.
+
+    Emitting a record only puts it in a queue: records are formatted
+    and written by a listener thread, so that logging code does not wait
+    for the terminal. flush() waits until the queued records are written.
+
+    Records are written to JSON Lines outputs as "log" records.
+    """
+
+    # The lowest level of the records written at each verbosity
+    LEVELS: ClassVar[dict[Verbosity, int]] = {
+        Verbosity.QUIET: logging.CRITICAL + 1,
+        Verbosity.NORMAL: logging.WARNING,
+        Verbosity.VERBOSE: logging.INFO,
+        Verbosity.VERY_VERBOSE: logging.INFO,
+        Verbosity.DEBUG: logging.DEBUG,
+    }
+
+    STYLES: ClassVar[dict[int, str]] = {
+        logging.CRITICAL: "error",
+        logging.ERROR: "error",
+        logging.WARNING: "comment",
+        logging.INFO: "info",
+    }
+
+    def __init__(
+        self, output: Output | None = None, verbosity: Verbosity = Verbosity.NORMAL
+    ) -> None:
+        self._queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        super().__init__(self._queue)
+
+        self._output = output
+        self._listener = QueueListener(
+            self._queue, _OutputWriter(self), respect_handler_level=False
+        )
+        self._started = False
+
+        self.set_verbosity(verbosity)
+
+    @property
+    def output(self) -> Output | None:
+        return self._output
+
+    def set_output(self, output: Output) -> None:
+        """
+        Writes the records to the given output, from now on.
+        """
+        self.flush()
+
+        self._output = output
+
+    def set_verbosity(self, verbosity: Verbosity) -> None:
+        """
+        Only handles the records written at the given verbosity,
+        so that the other ones are not queued.
+        """
+        self.setLevel(self.LEVELS[verbosity])
+
+    def start(self) -> None:
+        """
+        Starts writing the queued records, from the listener thread.
+        """
+        if not self._started:
+            self._started = True
+            self._listener.start()
+
+    def stop(self) -> None:
+        """
+        Writes the queued records and stops the listener thread.
+        """
+        if self._started:
+            self._started = False
+            self._listener.stop()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merges the arguments and the exception into the record, while they
+        can not be modified anymore: only styling and writing are left to
+        the listener thread.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+
+        if record.exc_info:
+            if not record.exc_text:
+                formatter = self.formatter or logging.Formatter()
+                record.exc_text = formatter.formatException(record.exc_info)
+
+            record.exc_info = None
+
+        return record
+
+    def flush(self) -> None:
+        if self._started:
+            self._queue.join()
+
+        if self._output is not None:
+            self._output.flush()
+
+    def close(self) -> None:
+        try:
+            self.stop()
+            self.flush()
+        finally:
+            super().close()
+
+    def _write(self, record: logging.LogRecord) -> None:
+        from cleo.io.outputs.json_lines_output import JsonLinesOutput
+
+        output = self._output
+        if output is None:
+            return
+
+        verbosity = self._get_verbosity(record.levelno)
+        if isinstance(output, JsonLinesOutput):
+            output.emit(
+                {
+                    "type": "log",
+                    "level": record.levelname,
+                    "logger": record.name,
+                    "message": self.format(record),
+                },
+                verbosity=verbosity,
+            )
+
+            return
+
+        message = Formatter.escape(self.format(record))
+        style = self._get_style(record.levelno)
+        if style is not None:
+            message = f"<{style}>{message}</>"
+
+        output.write_line(message, verbosity=verbosity)
+
+    def _get_verbosity(self, level: int) -> Verbosity:
+        for verbosity, lowest_level in self.LEVELS.items():
+            if level >= lowest_level:
+                return verbosity
+
+        return Verbosity.DEBUG
+
+    def _get_style(self, level: int) -> str | None:
+        for lowest_level, style in sorted(self.STYLES.items(), reverse=True):
+            if level >= lowest_level:
+                return style
+
+        return None
+
+
+class _OutputWriter(logging.Handler):
+    """
+    Writes the records of the listener thread through a LogHandler.
+    """
+
+    def __init__(self, handler: LogHandler) -> None:
+        super().__init__()
+
+        self._handler = handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._handler._write(record)
+        except Exception:
+            self.handleError(record)
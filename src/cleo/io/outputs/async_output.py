@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+
+from typing import TYPE_CHECKING
+
+from cleo.io.outputs.output import Type
+from cleo.io.outputs.output import Verbosity
+from cleo.io.outputs.stream_output import StreamOutput
+
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from cleo.io.outputs.output import Messages
+    from cleo.io.outputs.output import Output
+
+
+class _WriteProtocol(asyncio.BaseProtocol):
+    """
+    Waits for the transport to be ready to accept more data.
+    """
+
+    def __init__(self) -> None:
+        self._paused = False
+        self._waiter: asyncio.Future[None] | None = None
+        self._error: BaseException | None = None
+        self._lost = False
+        self._closed = asyncio.get_running_loop().create_future()
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        self._wake_up()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._lost = True
+        self._error = exc
+        self._wake_up()
+
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def check(self) -> None:
+        self.check_error()
+
+        if self._lost:
+            raise BrokenPipeError("The output is closed")
+
+    def check_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    async def drain(self) -> None:
+        self.check()
+
+        if not self._paused:
+            return
+
+        self._waiter = asyncio.get_running_loop().create_future()
+        try:
+            await self._waiter
+        finally:
+            self._waiter = None
+
+        self.check()
+
+    async def wait_closed(self) -> None:
+        await self._closed
+
+    def _wake_up(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+
+class AsyncOutput:
+    """
+    Writes to an output without blocking the running event loop.
+
+    Messages are formatted by the output's formatter and filtered by its
+    verbosity. When the output is a StreamOutput whose stream is a pipe
+    or a socket, they are written through a transport of the event loop.
+    Otherwise, they are written by the default executor.
+
+    The transport sets its file descriptor to non-blocking mode. Until
+    close() or detach() restores it, the stream should not be written
+    synchronously, by the output itself or any other. Terminals, and
+    pipes and sockets shared with another standard stream, are never
+    written through a transport: the other streams would be affected.
+    """
+
+    def __init__(self, output: Output) -> None:
+        self._output = output
+        self._transport: asyncio.WriteTransport | None = None
+        self._protocol: _WriteProtocol | None = None
+        self._fd = -1
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._encoding = "utf-8"
+        self._errors = "strict"
+        self._connected = False
+        self._lock: asyncio.Lock | None = None
+
+    @property
+    def output(self) -> Output:
+        return self._output
+
+    async def write_line(
+        self,
+        messages: Messages,
+        verbosity: Verbosity = Verbosity.NORMAL,
+        type: Type = Type.NORMAL,
+    ) -> None:
+        await self.write(messages, new_line=True, verbosity=verbosity, type=type)
+
+    async def write(
+        self,
+        messages: Messages,
+        new_line: bool = False,
+        verbosity: Verbosity = Verbosity.NORMAL,
+        type: Type = Type.NORMAL,
+    ) -> None:
+        if not self._output.is_enabled(verbosity):
+            return
+
+        if callable(messages):
+            messages = messages()
+
+        if isinstance(messages, str):
+            messages = [messages]
+
+        separator = "\n" if new_line else ""
+        text = "".join(
+            f"{message}{separator}"
+            for message in self._output._format_messages(messages, type)
+        )
+        if text:
+            await self._write(text)
+
+    async def flush(self) -> None:
+        """
+        Waits until the output can accept more data without buffering.
+        """
+        if self._protocol is not None:
+            await self._protocol.drain()
+        else:
+            await self._run_in_executor(self._output.flush)
+
+    async def close(self) -> None:
+        """
+        Waits until everything written is handed to the system
+        and closes the transport, if any.
+        """
+        transport, protocol = self._transport, self._protocol
+        self._transport = None
+        self._protocol = None
+        self._loop = None
+        self._connected = False
+
+        if transport is None or protocol is None:
+            await self._run_in_executor(self._output.flush)
+
+            return
+
+        # The transport writes what it buffers before being closed
+        transport.close()
+        await protocol.wait_closed()
+
+        # The file descriptor is shared with the synchronous stream
+        os.set_blocking(self._fd, True)
+
+        protocol.check_error()
+
+    def detach(self) -> None:
+        """
+        Closes the transport, if any, without waiting,
+        dropping what it did not write yet.
+
+        Unlike close(), it can be called once the event loop is closed.
+        """
+        transport, loop = self._transport, self._loop
+        self._transport = None
+        self._protocol = None
+        self._loop = None
+        self._connected = False
+
+        if transport is None or loop is None:
+            return
+
+        # The file descriptor is shared with the synchronous stream
+        os.set_blocking(self._fd, True)
+
+        pipe = transport.get_extra_info("pipe")
+        if not loop.is_closed():
+            transport.abort()
+
+        pipe.close()
+
+    async def _write(self, text: str) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        # Concurrent writes are done in order
+        async with self._lock:
+            if not self._connected:
+                await self._connect()
+
+            if self._transport is None or self._protocol is None:
+                await self._run_in_executor(self._output._write, text)
+
+                return
+
+            self._protocol.check()
+            self._transport.write(text.encode(self._encoding, self._errors))
+            await self._protocol.drain()
+
+    async def _connect(self) -> None:
+        self._connected = True
+
+        if not isinstance(self._output, StreamOutput):
+            return
+
+        stream = self._output.stream
+        try:
+            fd = stream.fileno()
+            if stream.isatty() or self._is_shared(fd):
+                return
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            return
+
+        # What was written synchronously comes first
+        self._output.flush()
+
+        # The transport closes the pipe it writes to, but not the stream
+        pipe = os.fdopen(os.dup(fd), "wb", buffering=0)
+        loop = asyncio.get_running_loop()
+        try:
+            transport, protocol = await loop.connect_write_pipe(_WriteProtocol, pipe)
+        except (ValueError, OSError, NotImplementedError):
+            # Regular files are not supported
+            pipe.close()
+
+            return
+
+        self._transport = transport
+        self._protocol = protocol
+        self._loop = loop
+        self._fd = fd
+        self._encoding = stream.encoding or "utf-8"
+        self._errors = stream.errors or "strict"
+
+    def _is_shared(self, fd: int) -> bool:
+        """
+        Returns whether the file descriptor refers to the same file
+        as another standard stream.
+        """
+        stat = os.fstat(fd)
+        for other_fd in (0, 1, 2):
+            if other_fd == fd:
+                continue
+
+            try:
+                other_stat = os.fstat(other_fd)
+            except OSError:
+                continue
+
+            if (other_stat.st_dev, other_stat.st_ino) == (stat.st_dev, stat.st_ino):
+                return True
+
+        return False
+
+    async def _run_in_executor(self, func: Callable[..., object], *args: str) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, func, *args)
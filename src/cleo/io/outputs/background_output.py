@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import atexit
+import queue
+import threading
+
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Iterable
+
+from cleo.io.outputs.output import Output
+
+
+if TYPE_CHECKING:
+    from cleo.io.outputs.section_output import SectionOutput
+
+
+class BackgroundWriter:
+    """
+    Writes to outputs from a dedicated thread.
+
+    Writes are handed to the thread through a bounded queue, so that
+    writing only blocks once max_size writes are pending. Writes to all
+    the outputs sharing a writer happen in the order they were made.
+
+    An error raised while writing is raised again by the next write,
+    flush() or close(). The writes pending until then are dropped,
+    the writes made afterwards are done.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self._queue: queue.Queue[Callable[[], Any] | None] = queue.Queue(max_size)
+        self._error: BaseException | None = None
+        self._failed = False
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="cleo-background-writer", daemon=True
+        )
+        self._thread.start()
+
+        # Pending writes must not be lost when the program exits
+        atexit.register(self.close)
+
+    def wrap(self, output: Output) -> BackgroundOutput:
+        """
+        Returns an output writing to the given one from the writer thread.
+        """
+        return BackgroundOutput(output, self)
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Schedules a call in the writer thread,
+        blocking while the queue is full.
+
+        Once the writer is closed, calls are made right away.
+        """
+        self._raise_error()
+
+        if self._closed:
+            func(*args, **kwargs)
+
+            return
+
+        self._queue.put(partial(func, *args, **kwargs))
+
+    def flush(self) -> None:
+        """
+        Waits until all the pending writes are done.
+        """
+        if not self._closed:
+            self._queue.join()
+
+        self._raise_error()
+
+    def close(self) -> None:
+        """
+        Does the pending writes and stops the writer thread.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        atexit.unregister(self.close)
+
+        self._queue.put(None)
+        self._thread.join()
+
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        error = self._error
+        if error is not None:
+            self._error = None
+            self._failed = False
+
+            raise error
+
+    def _run(self) -> None:
+        closing = False
+        while True:
+            try:
+                # Writes submitted while closing are still done, in order
+                task = self._queue.get_nowait() if closing else self._queue.get()
+            except queue.Empty:
+                return
+
+            try:
+                if task is None:
+                    closing = True
+                elif not self._failed:
+                    task()
+            except BaseException as e:
+                # Set first, so that raising the error resets it
+                self._failed = True
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+
+class BackgroundOutput(Output):
+    """
+    An output formatting messages in the calling thread
+    and writing them to another output from a BackgroundWriter thread.
+    """
+
+    def __init__(self, output: Output, writer: BackgroundWriter) -> None:
+        super().__init__(
+            verbosity=output.verbosity,
+            decorated=output.is_decorated(),
+            formatter=output.formatter,
+        )
+
+        self._output = output
+        self._writer = writer
+
+    @property
+    def output(self) -> Output:
+        return self._output
+
+    @property
+    def writer(self) -> BackgroundWriter:
+        return self._writer
+
+    def supports_utf8(self) -> bool:
+        return self._output.supports_utf8()
+
+    def flush(self) -> None:
+        self._writer.submit(self._output.flush)
+        self._writer.flush()
+
+    def section(self) -> SectionOutput:
+        # Sections rewrite what was written, which must be done first
+        self.flush()
+
+        return self._output.section()
+
+    def _write(self, message: str, new_line: bool = False) -> None:
+        self._writer.submit(self._output._write, message, new_line=new_line)
+
+    def _write_many(self, messages: Iterable[str], new_line: bool = False) -> None:
+        self._submit_batch(self._output._write_many, messages, new_line)
+
+    def _write_raw(self, messages: Iterable[str], new_line: bool = False) -> None:
+        self._submit_batch(self._output._write_raw, messages, new_line)
+
+    def _submit_batch(
+        self,
+        write: Callable[[Iterable[str], bool], None],
+        messages: Iterable[str],
+        new_line: bool,
+    ) -> None:
+        # Messages are formatted in the calling thread
+        batch: list[str] = []
+        try:
+            batch.extend(messages)
+        finally:
+            if batch:
+                self._writer.submit(write, batch, new_line)
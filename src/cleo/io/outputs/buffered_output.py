@@ -1,28 +1,38 @@
 from __future__ import annotations
 
-from io import StringIO
 from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import cast
 
 from cleo.io.outputs.output import Output
 from cleo.io.outputs.output import Verbosity
 from cleo.io.outputs.section_output import SectionOutput
+from cleo.io.outputs.spooled_buffer import SpooledBuffer
 
 
 if TYPE_CHECKING:
+    from typing import Iterator
+    from typing import TextIO
+
     from cleo.formatters.formatter import Formatter
 
 
 class BufferedOutput(Output):
+    # Number of characters kept in memory
+    # before the content is written to a temporary file.
+    MAX_MEMORY_SIZE = 16 * 1024 * 1024
+
     def __init__(
         self,
         verbosity: Verbosity = Verbosity.NORMAL,
         decorated: bool = False,
         formatter: Formatter | None = None,
         supports_utf8: bool = True,
+        max_memory_size: int | None = None,
     ) -> None:
         super().__init__(decorated=decorated, verbosity=verbosity, formatter=formatter)
 
-        self._buffer = StringIO()
+        self._buffer = SpooledBuffer(max_memory_size or self.MAX_MEMORY_SIZE)
         self._supports_utf8 = supports_utf8
 
     def fetch(self) -> str:
@@ -30,15 +40,28 @@ class BufferedOutput(Output):
         Empties the buffer and returns its content.
         """
         content = self._buffer.getvalue()
-        self._buffer = StringIO()
+        self._buffer.clear()
 
         return content
 
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Iterates over the lines of the buffer, including their new line,
+        without loading it all in memory.
+        """
+        return self._buffer.iter_lines()
+
+    def tail(self, lines: int) -> str:
+        """
+        Returns the given number of lines from the end of the buffer.
+        """
+        return self._buffer.tail(lines)
+
     def clear(self) -> None:
         """
         Empties the buffer.
         """
-        self._buffer = StringIO()
+        self._buffer.clear()
 
     def supports_utf8(self) -> bool:
         return self._supports_utf8
@@ -48,11 +71,12 @@ class BufferedOutput(Output):
 
     def section(self) -> SectionOutput:
         return SectionOutput(
-            self._buffer,
+            cast("TextIO", self._buffer),
             self._section_outputs,
             verbosity=self.verbosity,
             decorated=self.is_decorated(),
             formatter=self.formatter,
+            compositor=self._section_compositor,
         )
 
     def _write(self, message: str, new_line: bool = False) -> None:
@@ -60,3 +84,9 @@ class BufferedOutput(Output):
 
         if new_line:
             self._buffer.write("\n")
+
+    def _write_many(self, messages: Iterable[str], new_line: bool = False) -> None:
+        if new_line:
+            messages = (f"{message}\n" for message in messages)
+
+        self._buffer.writelines(messages)
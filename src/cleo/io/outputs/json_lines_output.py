@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Iterable
+
+from cleo.io.outputs.output import Output
+from cleo.io.outputs.output import Type
+from cleo.io.outputs.output import Verbosity
+
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from cleo.io.outputs.output import Messages
+    from cleo.io.outputs.section_output import SectionOutput
+
+
+class JsonLinesOutput(Output):
+    """
+    Writes JSON Lines records to another output, for programs to read.
+
+    Components emit their own records, like a record per table row.
+    Messages written as text are emitted as "line" records, one per
+    message, with their tags removed: they are not formatted, escaped
+    tags are kept as text.
+
+    Records are written as soon as they are emitted, and flushed
+    according to the buffering policy of the output.
+    """
+
+    def __init__(self, output: Output) -> None:
+        super().__init__(verbosity=output.verbosity, decorated=False)
+
+        self._output = output
+        # Characters the output cannot encode are escaped
+        self._ensure_ascii = not output.supports_utf8()
+        self._text: list[str] = []
+
+    @property
+    def output(self) -> Output:
+        return self._output
+
+    def set_verbosity(self, verbosity: Verbosity) -> None:
+        super().set_verbosity(verbosity)
+
+        self._output.set_verbosity(verbosity)
+
+    def is_decorated(self) -> bool:
+        return False
+
+    def decorated(self, decorated: bool = True) -> None:
+        pass
+
+    def supports_utf8(self) -> bool:
+        return self._output.supports_utf8()
+
+    def emit(
+        self, record: dict[str, Any], verbosity: Verbosity = Verbosity.NORMAL
+    ) -> None:
+        """
+        Writes a record.
+        """
+        if not self.is_enabled(verbosity):
+            return
+
+        self._emit([record])
+
+    def emit_line(
+        self,
+        text: str | Callable[[], str],
+        style: str | None = None,
+        verbosity: Verbosity = Verbosity.NORMAL,
+    ) -> None:
+        """
+        Writes a "line" record with the style of the line, if any.
+        """
+        if not self.is_enabled(verbosity):
+            return
+
+        if callable(text):
+            text = text()
+
+        text = self.remove_format(text)
+        if self._text:
+            text = "".join([*self._text, text])
+            self._text.clear()
+
+        record = {"type": "line", "text": text}
+        if style:
+            record["style"] = style
+
+        self._emit([record])
+
+    def write(
+        self,
+        messages: Messages,
+        new_line: bool = False,
+        verbosity: Verbosity = Verbosity.NORMAL,
+        type: Type = Type.NORMAL,
+    ) -> None:
+        if not self.is_enabled(verbosity):
+            return
+
+        if callable(messages):
+            messages = messages()
+
+        if isinstance(messages, str):
+            messages = [messages]
+
+        if type is not Type.RAW:
+            messages = map(self.remove_format, messages)
+
+        if new_line:
+            self._write_many(messages, new_line=True)
+        else:
+            self._text.extend(messages)
+
+    def flush(self) -> None:
+        if self._text:
+            self._write("", new_line=True)
+
+        self._output.flush()
+
+    def section(self) -> SectionOutput:
+        return self._output.section()
+
+    def _write(self, message: str, new_line: bool = False) -> None:
+        self._write_many([message], new_line=new_line)
+
+    def _write_many(self, messages: Iterable[str], new_line: bool = False) -> None:
+        if not new_line:
+            # Messages written without a new line are part of the next line
+            self._text.extend(messages)
+
+            return
+
+        records = []
+        for message in messages:
+            if self._text:
+                message = "".join([*self._text, message])
+                self._text.clear()
+
+            records.append({"type": "line", "text": message})
+
+        self._emit(records)
+
+    def _emit(self, records: list[dict[str, Any]]) -> None:
+        # Records go through the buffer of the output, like text
+        self._output._write_many(
+            [
+                json.dumps(
+                    record,
+                    ensure_ascii=self._ensure_ascii,
+                    separators=(",", ":"),
+                    default=str,
+                )
+                for record in records
+            ],
+            new_line=True,
+        )
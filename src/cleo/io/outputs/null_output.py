@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import TYPE_CHECKING
 
 from cleo.io.outputs.output import Output
 from cleo.io.outputs.output import Type
 from cleo.io.outputs.output import Verbosity
 
 
+if TYPE_CHECKING:
+    from cleo.io.outputs.output import Messages
+
+
 class NullOutput(Output):
     @property
     def verbosity(self) -> Verbosity:
@@ -24,6 +28,9 @@ class NullOutput(Output):
     def set_verbosity(self, verbosity: Verbosity) -> None:
         pass
 
+    def is_enabled(self, verbosity: Verbosity) -> bool:
+        return False
+
     def is_quiet(self) -> bool:
         return True
 
@@ -38,7 +45,7 @@ class NullOutput(Output):
 
     def write_line(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: Type = Type.NORMAL,
     ) -> None:
@@ -46,7 +53,7 @@ class NullOutput(Output):
 
     def write(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         new_line: bool = False,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: Type = Type.NORMAL,
@@ -2,13 +2,19 @@ from __future__ import annotations
 
 from enum import Enum
 from typing import TYPE_CHECKING
+from typing import Callable
 from typing import Iterable
+from typing import Iterator
+from typing import Union
 
 from cleo._utils import strip_tags
 from cleo.formatters.formatter import Formatter
 
 
 if TYPE_CHECKING:
+    from cleo.formatters.template import CompiledTemplate
+    from cleo.io.outputs.render_scheduler import RenderScheduler
+    from cleo.io.outputs.section_compositor import SectionCompositor
     from cleo.io.outputs.section_output import SectionOutput
 
 
@@ -26,6 +32,11 @@ class Type(Enum):
     PLAIN: int = 4
 
 
+# Messages, or a function returning them,
+# only called if the messages are written.
+Messages = Union[str, Iterable[str], Callable[[], Union[str, Iterable[str]]]]
+
+
 class Output:
     def __init__(
         self,
@@ -34,10 +45,14 @@ class Output:
         formatter: Formatter | None = None,
     ) -> None:
         self._verbosity: Verbosity = verbosity
+        # Enum.value is a property, slower than the attribute it returns
+        self._verbosity_level: int = verbosity._value_
         self._formatter = formatter or Formatter()
         self._formatter.decorated(decorated)
 
         self._section_outputs: list[SectionOutput] = []
+        self._section_compositor: SectionCompositor | None = None
+        self._render_scheduler: RenderScheduler | None = None
 
     @property
     def formatter(self) -> Formatter:
@@ -47,6 +62,14 @@ class Output:
     def verbosity(self) -> Verbosity:
         return self._verbosity
 
+    @property
+    def render_scheduler(self) -> RenderScheduler | None:
+        """
+        The scheduler drawing the updates of live components
+        writing to this output, if any.
+        """
+        return self._render_scheduler
+
     def set_formatter(self, formatter: Formatter) -> None:
         self._formatter = formatter
 
@@ -64,6 +87,13 @@ class Output:
 
     def set_verbosity(self, verbosity: Verbosity) -> None:
         self._verbosity = verbosity
+        self._verbosity_level = verbosity._value_
+
+    def is_enabled(self, verbosity: Verbosity) -> bool:
+        """
+        Returns whether messages of the given verbosity are written.
+        """
+        return verbosity._value_ <= self._verbosity_level
 
     def is_quiet(self) -> bool:
         return self._verbosity is Verbosity.QUIET
@@ -79,7 +109,7 @@ class Output:
 
     def write_line(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: Type = Type.NORMAL,
     ) -> None:
@@ -87,24 +117,66 @@ class Output:
 
     def write(
         self,
-        messages: str | Iterable[str],
+        messages: Messages,
         new_line: bool = False,
         verbosity: Verbosity = Verbosity.NORMAL,
         type: Type = Type.NORMAL,
     ) -> None:
-        if isinstance(messages, str):
-            messages = [messages]
+        """
+        Writes messages of the given verbosity.
 
-        if verbosity.value > self.verbosity.value:
+        Messages may be given as a function returning them, which is
+        only called if messages of this verbosity are written.
+        """
+        if not self.is_enabled(verbosity):
             return
 
-        for message in messages:
-            if type is Type.NORMAL:
-                message = self._formatter.format(message)
-            elif type is Type.PLAIN:
-                message = strip_tags(self._formatter.format(message))
+        if callable(messages):
+            messages = messages()
 
-            self._write(message, new_line=new_line)
+        if type is Type.RAW:
+            if isinstance(messages, str):
+                messages = [messages]
+
+            self._write_raw(messages, new_line=new_line)
+        elif isinstance(messages, str):
+            self._write(self._format_message(messages, type), new_line=new_line)
+        else:
+            self._write_many(self._format_messages(messages, type), new_line=new_line)
+
+    def write_stream(
+        self,
+        chunks: Iterable[str],
+        new_line: bool = False,
+        verbosity: Verbosity = Verbosity.NORMAL,
+        type: Type = Type.NORMAL,
+    ) -> None:
+        """
+        Writes a single message produced in chunks, for instance by a generator,
+        without holding the whole message in memory.
+
+        Tags may span several chunks.
+        """
+        if not self.is_enabled(verbosity):
+            return
+
+        if type is Type.RAW:
+            for chunk in chunks:
+                self._write(chunk)
+        else:
+            try:
+                for chunk in chunks:
+                    message = self._formatter.feed(chunk)
+                    if message:
+                        self._write_formatted(message, type)
+            finally:
+                message = self._formatter.close()
+
+            if message:
+                self._write_formatted(message, type)
+
+        if new_line:
+            self._write("", new_line=True)
 
     def flush(self) -> None:
         pass
@@ -112,8 +184,67 @@ class Output:
     def remove_format(self, text: str) -> str:
         return self.formatter.remove_format(text)
 
+    def visible_width(self, text: str) -> int:
+        return self.formatter.visible_width(text)
+
+    def compile(self, template: str) -> CompiledTemplate:
+        """
+        Compiles a markup template for this output's formatter.
+
+        Rendered templates are already formatted
+        and should be written with the RAW type.
+        """
+        return self.formatter.compile(template)
+
     def section(self) -> SectionOutput:
         raise NotImplementedError
 
+    def use_section_compositor(self, use: bool = True) -> None:
+        """
+        Makes the sections created from now on redraw only the lines
+        which changed when they are written to, instead of everything below them.
+
+        Their content is then limited to the height of the terminal.
+        """
+        from cleo.io.outputs.section_compositor import SectionCompositor
+
+        self._section_compositor = (
+            SectionCompositor(self._section_outputs) if use else None
+        )
+
+    def _format_message(self, message: str, type: Type) -> str:
+        if type is Type.NORMAL:
+            return self._formatter.format(message)
+
+        if type is Type.PLAIN:
+            return strip_tags(self._formatter.format(message))
+
+        return message
+
+    def _format_messages(self, messages: Iterable[str], type: Type) -> Iterator[str]:
+        for message in messages:
+            yield self._format_message(message, type)
+
+    def _write_formatted(self, message: str, type: Type) -> None:
+        if type is Type.PLAIN:
+            message = strip_tags(message)
+
+        self._write(message)
+
     def _write(self, message: str, new_line: bool = False) -> None:
         raise NotImplementedError
+
+    def _write_raw(self, messages: Iterable[str], new_line: bool = False) -> None:
+        """
+        Writes messages which are not formatted.
+        """
+        self._write_many(messages, new_line=new_line)
+
+    def _write_many(self, messages: Iterable[str], new_line: bool = False) -> None:
+        """
+        Writes several formatted messages.
+
+        Outputs override it to write them more efficiently than one by one.
+        """
+        for message in messages:
+            self._write(message, new_line=new_line)
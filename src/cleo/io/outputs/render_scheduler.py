@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+
+from typing import TYPE_CHECKING
+from typing import Callable
+
+from cleo.exceptions import CleoValueError
+
+
+if TYPE_CHECKING:
+    from cleo.io.outputs.stream_output import StreamOutput
+
+
+class RenderScheduler:
+    """
+    Draws the updates of live components, like sections with a compositor,
+    progress bars and progress indicators, in frames drawn at most fps times
+    per second.
+
+    Only the last update scheduled by a component before a frame is drawn.
+    Everything written to the output while drawing a frame is written to
+    its stream at once.
+
+    Pending updates are drawn before anything else is written to the output,
+    when it is flushed and when the program exits.
+    """
+
+    def __init__(self, output: StreamOutput, fps: float = 30) -> None:
+        if fps <= 0:
+            raise CleoValueError("The number of frames per second must be positive")
+
+        self._output = output
+        self._interval = 1 / fps
+        # Updates are scheduled and frames drawn from different threads
+        self._lock = threading.RLock()
+        self._pending: dict[object, Callable[[], None]] = {}
+        self._frame: list[str] | None = None
+        self._frame_thread: int | None = None
+        self._last_frame_time = 0.0
+        self._timer: threading.Timer | None = None
+        self._closed = False
+
+        atexit.register(self.close)
+
+    @property
+    def fps(self) -> float:
+        return 1 / self._interval
+
+    @property
+    def lock(self) -> threading.RLock:
+        """
+        The lock held while drawing a frame,
+        to hold while changing what is drawn.
+        """
+        return self._lock
+
+    def schedule(self, key: object, render: Callable[[], None]) -> None:
+        """
+        Schedules the update of a component, replacing its previous one.
+
+        The update is drawn right away if the last frame is old enough,
+        with the next frame otherwise.
+        """
+        with self._lock:
+            self._pending[key] = render
+
+            if self._frame is not None:
+                # Updates scheduled while drawing are part of the frame
+                return
+
+            delay = self._last_frame_time + self._interval - time.monotonic()
+            if delay <= 0 or self._closed:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def is_drawing(self) -> bool:
+        """
+        Returns whether a frame is being drawn by the current thread.
+        """
+        return self._frame is not None and self._frame_thread == threading.get_ident()
+
+    def capture(self, text: str) -> bool:
+        """
+        Adds text written while drawing a frame to the frame.
+
+        Otherwise, draws the pending updates,
+        so that the text is written after them, and returns False.
+        """
+        if self.is_drawing():
+            assert self._frame is not None
+            self._frame.append(text)
+
+            return True
+
+        self.flush()
+
+        return False
+
+    def flush(self) -> None:
+        """
+        Draws the pending updates.
+        """
+        with self._lock:
+            if self._frame is not None:
+                return
+
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            if not self._pending:
+                return
+
+            self._frame = []
+            self._frame_thread = threading.get_ident()
+            try:
+                while self._pending:
+                    key = next(iter(self._pending))
+                    self._pending.pop(key)()
+            finally:
+                frame = "".join(self._frame)
+                self._frame = None
+                self._frame_thread = None
+                self._last_frame_time = time.monotonic()
+
+                if frame:
+                    self._output._write_frame(frame)
+
+    def close(self) -> None:
+        """
+        Draws the pending updates.
+        Updates scheduled afterwards are drawn right away.
+        """
+        if not self._closed:
+            self._closed = True
+            atexit.unregister(self.close)
+
+        self.flush()
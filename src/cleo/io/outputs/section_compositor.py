@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Tuple
+
+from cleo.terminal import TerminalGeometry
+
+
+if TYPE_CHECKING:
+    from cleo.io.outputs.section_output import SectionOutput
+    from cleo.terminal import Terminal
+
+
+# A displayed line and the number of terminal rows it takes
+Line = Tuple[str, int]
+
+
+class SectionCompositor:
+    """
+    Redraws the sections of an output by rewriting only the lines which changed.
+
+    It keeps the lines displayed by all the sections, up to the height of
+    the terminal: lines scrolled out of the terminal cannot be redrawn,
+    so the sections do not keep them either.
+    """
+
+    def __init__(
+        self,
+        sections: list[SectionOutput],
+        terminal: Terminal | TerminalGeometry | None = None,
+    ) -> None:
+        self._sections = sections
+        self._terminal = terminal or TerminalGeometry.shared()
+        self._screen: list[Line] = []
+
+    @property
+    def max_rows(self) -> int:
+        """
+        The number of rows the sections can take,
+        above the row of the cursor.
+        """
+        return max(1, self._terminal.height - 1)
+
+    def render(self) -> str:
+        """
+        Returns what to write to display the current content of the sections,
+        given that the previous one is displayed.
+        """
+        lines: list[Line] = []
+        # Sections are displayed in the order they were created
+        for section in reversed(self._sections):
+            if section.compositor is self:
+                lines.extend(section.screen_lines())
+
+        rows = sum(line_rows for _, line_rows in lines)
+        start = 0
+        while rows > self.max_rows and start < len(lines) - 1:
+            rows -= lines[start][1]
+            start += 1
+
+        lines = lines[start:]
+        output = self._diff(self._screen, lines)
+        self._screen = lines
+
+        return output
+
+    def _diff(self, old: list[Line], new: list[Line]) -> str:
+        if old == new:
+            return ""
+
+        output: list[str] = []
+        # Rows are counted from the first line of the sections,
+        # the cursor being at the start of the row after the last line.
+        cursor = sum(rows for _, rows in old)
+
+        def move_to(row: int) -> None:
+            nonlocal cursor
+
+            if row == cursor:
+                return
+
+            if row < cursor:
+                output.append(f"\x1b[{cursor - row}A\r")
+            else:
+                output.append(f"\x1b[{row - cursor}B\r")
+
+            cursor = row
+
+        row = 0
+        redraw_from = min(len(old), len(new))
+        for i in range(redraw_from):
+            old_line, new_line = old[i], new[i]
+            if old_line == new_line:
+                row += old_line[1]
+                continue
+
+            if old_line[1] != 1 or new_line[1] != 1:
+                # Lines below a line wrapped differently are moved
+                redraw_from = i
+                break
+
+            move_to(row)
+            output.append(f"\x1b[2K{new_line[0]}")
+            row += 1
+
+        move_to(row)
+        if redraw_from < len(old):
+            output.append("\x1b[0J")
+
+        for text, rows in new[redraw_from:]:
+            output.append(f"{text}\n")
+            cursor += rows
+
+        return "".join(output)
@@ -2,16 +2,25 @@ from __future__ import annotations
 
 import math
 
+from contextlib import nullcontext
 from typing import TYPE_CHECKING
+from typing import ContextManager
+from typing import Iterable
 from typing import TextIO
 
+from cleo.io.outputs.output import Output
 from cleo.io.outputs.output import Verbosity
 from cleo.io.outputs.stream_output import StreamOutput
-from cleo.terminal import Terminal
+from cleo.terminal import TerminalGeometry
 
 
 if TYPE_CHECKING:
     from cleo.formatters.formatter import Formatter
+    from cleo.io.outputs.render_scheduler import RenderScheduler
+    from cleo.io.outputs.section_compositor import Line
+    from cleo.io.outputs.section_compositor import SectionCompositor
+    from cleo.io.outputs.stream_output import Buffering
+    from cleo.terminal import TerminalSize
 
 
 class SectionOutput(StreamOutput):
@@ -22,16 +31,41 @@ class SectionOutput(StreamOutput):
         verbosity: Verbosity = Verbosity.NORMAL,
         decorated: bool | None = None,
         formatter: Formatter | None = None,
+        buffering: Buffering | None = None,
+        flush_interval: float = 0.1,
+        encoding_errors: str | None = None,
+        compositor: SectionCompositor | None = None,
+        render_scheduler: RenderScheduler | None = None,
     ) -> None:
+        """
+        With a compositor, writing to the section only redraws
+        the lines of the sections which changed, and the section
+        only keeps the lines fitting in the terminal.
+
+        With a render scheduler as well, the lines are redrawn
+        with the next frame of the scheduler.
+        """
         super().__init__(
-            stream, verbosity=verbosity, decorated=decorated, formatter=formatter
+            stream,
+            verbosity=verbosity,
+            decorated=decorated,
+            formatter=formatter,
+            buffering=buffering,
+            flush_interval=flush_interval,
+            encoding_errors=encoding_errors,
         )
 
         self._content: list[str] = []
         self._lines = 0
+        # Number of rows taken by each line of the content
+        self._line_rows: list[int] = []
         sections.insert(0, self)
         self._sections = sections
-        self._terminal = Terminal().size
+        self._terminal = TerminalGeometry.shared()
+        self._terminal.watch_resizes()
+        self._terminal.subscribe(self._resized)
+        self._compositor = compositor
+        self._render_scheduler = render_scheduler
 
     @property
     def content(self) -> str:
@@ -41,16 +75,36 @@ class SectionOutput(StreamOutput):
     def lines(self) -> int:
         return self._lines
 
+    @property
+    def compositor(self) -> SectionCompositor | None:
+        return self._compositor
+
+    def screen_lines(self) -> list[Line]:
+        """
+        Returns the lines of the content
+        with the number of terminal rows they take.
+        """
+        return list(zip(self._content[::2], self._line_rows))
+
     def clear(self, lines: int | None = None) -> None:
         if not (self._content and self.is_decorated()):
             return
 
+        if self._compositor is not None:
+            with self._content_lock():
+                self._remove_lines(lines)
+                self._render()
+
+            return
+
         if lines:
             # Multiply lines by 2 to cater for each new line added between content
             del self._content[-lines * 2 :]
+            del self._line_rows[-lines:]
         else:
             lines = self._lines
             self._content = []
+            self._line_rows = []
 
         self._lines -= lines
 
@@ -59,26 +113,44 @@ class SectionOutput(StreamOutput):
         )
 
     def overwrite(self, message: str) -> None:
+        if self._compositor is not None and self.is_decorated():
+            # The section is redrawn once, with the new message
+            with self._content_lock():
+                self._remove_lines()
+                self.write_line(message)
+
+            return
+
         self.clear()
         self.write_line(message)
 
     def add_content(self, content: str) -> None:
+        width = self._terminal.width
         for line_content in content.split("\n"):
-            self._lines += (
-                math.ceil(
-                    len(self.remove_format(line_content).replace("\t", " " * 8))
-                    / self._terminal.width
-                )
-                or 1
-            )
+            rows = self._get_rows(line_content, width)
+            self._lines += rows
+            self._line_rows.append(rows)
             self._content.append(line_content)
             self._content.append("\n")
 
+        if self._compositor is not None:
+            # Lines out of the terminal are not displayed anymore
+            excess = len(self._line_rows) - self._compositor.max_rows
+            if excess > 0:
+                self._remove_lines(excess, from_start=True)
+
     def _write(self, message: str, new_line: bool = False) -> None:
         if not self.is_decorated():
             super()._write(message, new_line=new_line)
             return
 
+        if self._compositor is not None:
+            with self._content_lock():
+                self.add_content(message)
+                self._render()
+
+            return
+
         erased_content = self._pop_stream_content_until_current_section()
 
         self.add_content(message)
@@ -86,6 +158,68 @@ class SectionOutput(StreamOutput):
         super()._write(message, new_line=True)
         super()._write(erased_content, new_line=False)
 
+    def _write_many(self, messages: Iterable[str], new_line: bool = False) -> None:
+        # Each message updates the content of the section
+        Output._write_many(self, messages, new_line=new_line)
+
+    def _write_raw(self, messages: Iterable[str], new_line: bool = False) -> None:
+        Output._write_raw(self, messages, new_line=new_line)
+
+    def _remove_lines(self, lines: int | None = None, from_start: bool = False) -> None:
+        """
+        Removes lines from the end of the content, or from its start.
+        """
+        if not lines:
+            self._content = []
+            self._line_rows = []
+            self._lines = 0
+        elif from_start:
+            self._lines -= sum(self._line_rows[:lines])
+            del self._content[: lines * 2]
+            del self._line_rows[:lines]
+        else:
+            self._lines -= sum(self._line_rows[-lines:])
+            del self._content[-lines * 2 :]
+            del self._line_rows[-lines:]
+
+    def _get_rows(self, line: str, width: int) -> int:
+        """
+        Returns the number of terminal rows a line takes.
+        """
+        return math.ceil(self.visible_width(line.replace("\t", " " * 8)) / width) or 1
+
+    def _resized(self, size: TerminalSize) -> None:
+        with self._content_lock():
+            self._line_rows = [
+                self._get_rows(line, size.width) for line in self._content[::2]
+            ]
+            self._lines = sum(self._line_rows)
+
+    def _content_lock(self) -> ContextManager[object]:
+        # Frames are drawn from the timer thread of the scheduler as well
+        if self._render_scheduler is None:
+            return nullcontext()
+
+        return self._render_scheduler.lock
+
+    def _render(self) -> None:
+        assert self._compositor is not None
+
+        if self._render_scheduler is not None:
+            # The compositor draws all the sections at once
+            self._render_scheduler.schedule(self._compositor, self._draw)
+
+            return
+
+        self._draw()
+
+    def _draw(self) -> None:
+        assert self._compositor is not None
+
+        output = self._compositor.render()
+        if output:
+            super()._write(output, new_line=False)
+
     def _pop_stream_content_until_current_section(
         self, lines_to_clear_count: int = 0
     ) -> str:
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import io
+import mmap
+import tempfile
+
+from contextlib import contextmanager
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import Iterable
+
+
+if TYPE_CHECKING:
+    from typing import Iterator
+
+
+class SpooledBuffer(io.TextIOBase):
+    """
+    A text buffer kept in memory until it holds more than max_size
+    characters, and written to a temporary file from then on.
+
+    Once written to a file, the content is read back through a memory map,
+    so that its lines can be iterated or its end read without loading it.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__()
+
+        self._max_size = max_size
+        self._chunks: list[str] = []
+        self._size = 0
+        self._file: IO[bytes] | None = None
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def is_spooled(self) -> bool:
+        """
+        Returns whether the content was written to a temporary file.
+        """
+        return self._file is not None
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        if self._file is not None:
+            self._file.write(_encode(s))
+
+            return len(s)
+
+        self._chunks.append(s)
+        self._size += len(s)
+        if self._size > self._max_size:
+            self._spool()
+
+        return len(s)
+
+    def writelines(self, lines: Iterable[str]) -> None:  # type: ignore[override]
+        for line in lines:
+            self.write(line)
+
+    def getvalue(self) -> str:
+        if self._file is None:
+            value = "".join(self._chunks)
+            self._chunks = [value]
+
+            return value
+
+        with self._map() as data:
+            return _decode(data[:])
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Iterates over the lines of the content, including their new line.
+
+        Lines written while iterating are not included.
+        """
+        if self._file is None:
+            yield from io.StringIO(self.getvalue())
+
+            return
+
+        with self._map() as data:
+            start = 0
+            end = len(data)
+            while start < end:
+                stop = data.find(b"\n", start, end) + 1 or end
+                yield _decode(data[start:stop])
+                start = stop
+
+    def tail(self, lines: int) -> str:
+        """
+        Returns the given number of lines from the end of the content.
+        """
+        if self._file is None:
+            value = self.getvalue()
+
+            return value[_tail_offset(value, "\n", lines) :]
+
+        with self._map() as data:
+            return _decode(data[_tail_offset(data, b"\n", lines) :])
+
+    def clear(self) -> None:
+        """
+        Empties the buffer.
+        """
+        self._chunks = []
+        self._size = 0
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self) -> None:
+        self.clear()
+
+        super().close()
+
+    def _spool(self) -> None:
+        self._file = tempfile.TemporaryFile(prefix="cleo-")  # noqa: SIM115
+        self._file.write(_encode("".join(self._chunks)))
+        self._chunks = []
+        self._size = 0
+
+    @contextmanager
+    def _map(self) -> Iterator[mmap.mmap]:
+        # The file is never empty, which could not be mapped
+        assert self._file is not None
+        self._file.flush()
+
+        with mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def _encode(text: str) -> bytes:
+    # Lone surrogates are kept as they are
+    return text.encode("utf-8", "surrogatepass")
+
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8", "surrogatepass")
+
+
+def _tail_offset(data: str | mmap.mmap, new_line: str | bytes, lines: int) -> int:
+    """
+    Returns the offset of the last lines of the data.
+    """
+    if lines <= 0:
+        return len(data)
+
+    end = len(data)
+    # The content may end with a complete line
+    if end and data[end - 1 : end] == new_line:
+        end -= 1
+
+    for _ in range(lines):
+        end = data.rfind(new_line, 0, end)  # type: ignore[arg-type]
+        if end == -1:
+            return 0
+
+    return end + 1
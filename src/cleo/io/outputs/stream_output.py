@@ -5,33 +5,85 @@ import io
 import locale
 import os
 import sys
+import threading
 
+from enum import Enum
 from typing import TYPE_CHECKING
+from typing import Iterable
 from typing import TextIO
+from typing import Union
 from typing import cast
 
+from cleo.color import ColorDepth
 from cleo.io.outputs.output import Output
 from cleo.io.outputs.output import Verbosity
 
 
 if TYPE_CHECKING:
     from cleo.formatters.formatter import Formatter
+    from cleo.io.outputs.render_scheduler import RenderScheduler
     from cleo.io.outputs.section_output import SectionOutput
 
 
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class Buffering(Enum):
+    """
+    When a StreamOutput flushes its stream.
+    """
+
+    # After every write
+    UNBUFFERED = 1
+    # After every write containing a new line
+    LINE = 2
+    # When the buffer of the stream is full
+    BLOCK = 3
+    # At most a given interval after a write
+    TIMED = 4
+
+
 class StreamOutput(Output):
     FILE_TYPE_CHAR = 0x0002
     FILE_TYPE_REMOTE = 0x8000
     ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
 
+    # Number of characters from several messages
+    # gathered before being written at once to the stream.
+    WRITE_CHUNK_SIZE = 64 * 1024
+
+    # Maximum number of buffers written by a single system call (IOV_MAX)
+    WRITE_MAX_BUFFERS = 1024
+
     def __init__(
         self,
         stream: TextIO,
         verbosity: Verbosity = Verbosity.NORMAL,
         decorated: bool | None = None,
         formatter: Formatter | None = None,
+        buffering: Buffering | None = None,
+        flush_interval: float = 0.1,
+        encoding_errors: str | None = None,
     ) -> None:
+        """
+        Streams are flushed after every write if they are interactive,
+        after every line if they are the standard error or write to the
+        same file, and only when their buffer is full otherwise,
+        unless a buffering policy is given.
+
+        With the TIMED policy, written messages are flushed
+        at most flush_interval seconds later.
+
+        Raw messages are encoded with the error handler of the stream,
+        unless another one is given.
+        """
         self._stream = stream
+        self._encoding = stream.encoding or "utf-8"
+        self._encoding_errors = encoding_errors or stream.errors or "strict"
+        self._buffering = buffering or self._get_default_buffering()
+        self._flush_interval = flush_interval
+        self._flush_timer: threading.Timer | None = None
+        self._lock = threading.RLock()
         self._supports_utf8 = self._get_utf8_support_info()
         super().__init__(
             verbosity=verbosity,
@@ -39,10 +91,17 @@ class StreamOutput(Output):
             formatter=formatter,
         )
 
+        if self._formatter.color_depth is None:
+            self._formatter.set_color_depth(self._get_color_depth())
+
     @property
     def stream(self) -> TextIO:
         return self._stream
 
+    @property
+    def buffering(self) -> Buffering:
+        return self._buffering
+
     def supports_utf8(self) -> bool:
         return self._supports_utf8
 
@@ -62,8 +121,71 @@ class StreamOutput(Output):
         except Exception:
             return True
 
+    def _get_color_depth(self) -> ColorDepth:
+        """
+        Returns the number of colors the terminal can display.
+        """
+        # Windows Terminal does not set COLORTERM
+        if sys.platform == "win32" and os.getenv("WT_SESSION"):
+            return ColorDepth.TRUECOLOR
+
+        return ColorDepth.from_environment()
+
+    def _get_raw_fileno(self) -> int | None:
+        """
+        Returns the file descriptor raw data can be written to, if any.
+        """
+        try:
+            # Consoles are not written bytes on Windows
+            if sys.platform == "win32" and self._stream.isatty():
+                return None
+
+            return self._stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    def _get_default_buffering(self) -> Buffering:
+        try:
+            is_interactive = self._stream.isatty()
+        except ValueError:
+            is_interactive = False
+
+        if is_interactive:
+            return Buffering.UNBUFFERED
+
+        # Like Python does, errors are not held back
+        if self._stream is sys.stderr or self._stream is sys.__stderr__:
+            return Buffering.LINE
+
+        # Streams written to the same file as the errors, like with
+        # "cmd > log 2>&1", must not hold back what comes before them
+        if self._shares_file_with(sys.stderr):
+            return Buffering.LINE
+
+        return Buffering.BLOCK
+
+    def _shares_file_with(self, stream: TextIO | None) -> bool:
+        """
+        Returns whether the stream writes to the same file as the given one.
+        """
+        try:
+            stat = os.fstat(self._stream.fileno())
+            other_stat = os.fstat(stream.fileno())  # type: ignore[union-attr]
+        except (AttributeError, OSError, ValueError):
+            return False
+
+        return (stat.st_dev, stat.st_ino) == (other_stat.st_dev, other_stat.st_ino)
+
     def flush(self) -> None:
-        self._stream.flush()
+        if self._render_scheduler is not None:
+            self._render_scheduler.flush()
+
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            self._stream.flush()
 
     def section(self) -> SectionOutput:
         from cleo.io.outputs.section_output import SectionOutput
@@ -74,14 +196,182 @@ class StreamOutput(Output):
             verbosity=self.verbosity,
             decorated=self.is_decorated(),
             formatter=self.formatter,
+            buffering=self._buffering,
+            flush_interval=self._flush_interval,
+            encoding_errors=self._encoding_errors,
+            compositor=self._section_compositor,
+            render_scheduler=self._render_scheduler,
         )
 
+    def use_render_scheduler(self, fps: float = 30) -> RenderScheduler:
+        """
+        Makes the updates of the progress bars and indicators writing to
+        this output, and of the sections created from now on, drawn in
+        frames at most fps times per second.
+
+        Sections created from now on use a compositor.
+        """
+        from cleo.io.outputs.render_scheduler import RenderScheduler
+
+        if self._section_compositor is None:
+            self.use_section_compositor()
+
+        self._render_scheduler = RenderScheduler(self, fps)
+
+        return self._render_scheduler
+
+    def write_bytes(
+        self,
+        data: Buffer | Iterable[Buffer],
+        new_line: bool = False,
+        verbosity: Verbosity = Verbosity.NORMAL,
+    ) -> None:
+        """
+        Writes already encoded data as is.
+
+        The data is written directly to the file descriptor
+        of the stream if it has one, several buffers at a time.
+        """
+        if not self.is_enabled(verbosity):
+            return
+
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = [data]
+
+        self._write_buffers(data, new_line=new_line)
+
+    def _write_raw(self, messages: Iterable[str], new_line: bool = False) -> None:
+        if self._get_raw_fileno() is None:
+            super()._write_raw(messages, new_line=new_line)
+
+            return
+
+        encoding, errors = self._encoding, self._encoding_errors
+        self._write_buffers(
+            (message.encode(encoding, errors) for message in messages),
+            new_line=new_line,
+        )
+
+    def _write_buffers(self, buffers: Iterable[Buffer], new_line: bool = False) -> None:
+        scheduler = self._render_scheduler
+        is_drawing = scheduler is not None and scheduler.is_drawing()
+        if scheduler is not None and not is_drawing:
+            scheduler.flush()
+
+        fd = self._get_raw_fileno()
+        if fd is None or is_drawing:
+            # Without a file descriptor, or while drawing a frame,
+            # the data goes through the text stream
+            self._write_many(
+                (
+                    bytes(buffer).decode(self._encoding, self._encoding_errors)
+                    for buffer in buffers
+                ),
+                new_line=new_line,
+            )
+
+            return
+
+        new_line_bytes = "\n".encode(self._encoding)
+        batch: list[memoryview] = []
+        batch_size = 0
+        with self._lock:
+            # What was written to the text stream comes first
+            self._stream.flush()
+
+            try:
+                for buffer in buffers:
+                    batch.append(memoryview(buffer).cast("B"))
+                    batch_size += batch[-1].nbytes
+                    if new_line:
+                        batch.append(memoryview(new_line_bytes))
+
+                    if (
+                        len(batch) >= self.WRITE_MAX_BUFFERS - 1
+                        or batch_size >= self.WRITE_CHUNK_SIZE
+                    ):
+                        pending, batch = batch, []
+                        batch_size = 0
+                        _write_all(fd, pending)
+            finally:
+                if batch:
+                    _write_all(fd, batch)
+
     def _write(self, message: str, new_line: bool = False) -> None:
         if new_line:
             message += "\n"
 
-        self._stream.write(message)
-        self._stream.flush()
+        if self._render_scheduler is not None and self._render_scheduler.capture(
+            message
+        ):
+            return
+
+        with self._lock:
+            self._stream.write(message)
+            self._written(message)
+
+    def _write_frame(self, frame: str) -> None:
+        """
+        Writes a frame drawn by the render scheduler.
+        """
+        with self._lock:
+            self._stream.write(frame)
+            self._stream.flush()
+
+    def _written(self, text: str) -> None:
+        """
+        Flushes the stream, or schedules it,
+        according to the buffering policy once text has been written.
+        """
+        if self._buffering is Buffering.UNBUFFERED:
+            self._stream.flush()
+        elif self._buffering is Buffering.LINE:
+            if "\n" in text:
+                self._stream.flush()
+        elif self._buffering is Buffering.TIMED and self._flush_timer is None:
+            self._flush_timer = threading.Timer(self._flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _write_many(self, messages: Iterable[str], new_line: bool = False) -> None:
+        scheduler = self._render_scheduler
+        if scheduler is not None:
+            if scheduler.is_drawing():
+                # Messages are part of the frame
+                super()._write_many(messages, new_line=new_line)
+
+                return
+
+            scheduler.flush()
+
+        chunk: list[str] = []
+        chunk_size = 0
+        written = False
+        has_new_line = new_line
+        try:
+            for message in messages:
+                if new_line:
+                    message += "\n"
+                elif not has_new_line:
+                    has_new_line = "\n" in message
+
+                chunk.append(message)
+                chunk_size += len(message)
+                if chunk_size >= self.WRITE_CHUNK_SIZE:
+                    with self._lock:
+                        self._stream.write("".join(chunk))
+                    chunk.clear()
+                    chunk_size = 0
+                    written = True
+        finally:
+            # Messages formatted before an error are still written
+            with self._lock:
+                if chunk:
+                    self._stream.write("".join(chunk))
+                    written = True
+
+                if written:
+                    self._written("\n" if has_new_line else "")
 
     def _has_color_support(self) -> bool:
         # Follow https://no-color.org/
@@ -157,3 +447,26 @@ class StreamOutput(Output):
             return os.isatty(self._stream.fileno())
         except io.UnsupportedOperation:
             return False
+
+
+def _write_all(fd: int, buffers: list[memoryview]) -> None:
+    """
+    Writes the buffers to the file descriptor,
+    retrying with what is left after partial writes.
+    """
+    if not hasattr(os, "writev"):
+        for buffer in buffers:
+            while buffer:
+                buffer = buffer[os.write(fd, buffer) :]
+
+        return
+
+    i = 0
+    while i < len(buffers):
+        written = os.writev(fd, buffers[i:])
+        while i < len(buffers) and written >= buffers[i].nbytes:
+            written -= buffers[i].nbytes
+            i += 1
+
+        if written:
+            buffers[i] = buffers[i][written:]
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Iterable
+
+from cleo.io.outputs.background_output import BackgroundWriter
+from cleo.io.outputs.output import Output
+from cleo.io.outputs.output import Type
+from cleo.io.outputs.output import Verbosity
+
+
+if TYPE_CHECKING:
+    from cleo.color import ColorDepth
+    from cleo.formatters.formatter import Formatter
+    from cleo.io.outputs.output import Messages
+
+
+class TeeOutput(Output):
+    """
+    Writes messages to several outputs.
+
+    Messages are formatted once for all the outputs sharing a decoration
+    mode, by the formatter of the first of them: they are expected to
+    share their styles. Each output only gets the messages of its verbosity.
+
+    Outputs added as background outputs are written to from the thread of
+    a BackgroundWriter, so that a slow output does not hold up the others.
+    """
+
+    def __init__(
+        self, outputs: Iterable[Output] = (), writer: BackgroundWriter | None = None
+    ) -> None:
+        super().__init__()
+
+        self._outputs: list[Output] = []
+        self._writer = writer
+        self._owns_writer = False
+
+        for output in outputs:
+            self.add_output(output)
+
+    @property
+    def outputs(self) -> list[Output]:
+        return list(self._outputs)
+
+    @property
+    def verbosity(self) -> Verbosity:
+        return max(
+            (output.verbosity for output in self._outputs),
+            key=lambda verbosity: verbosity.value,
+            default=Verbosity.QUIET,
+        )
+
+    @property
+    def formatter(self) -> Formatter:
+        """
+        The formatter of the first output, shared by those of the same
+        decoration mode.
+        """
+        if not self._outputs:
+            return self._formatter
+
+        return self._outputs[0].formatter
+
+    def set_formatter(self, formatter: Formatter) -> None:
+        super().set_formatter(formatter)
+
+        for output in self._outputs:
+            output.set_formatter(formatter)
+
+    def is_enabled(self, verbosity: Verbosity) -> bool:
+        return any(output.is_enabled(verbosity) for output in self._outputs)
+
+    def is_quiet(self) -> bool:
+        return self.verbosity is Verbosity.QUIET
+
+    def is_verbose(self) -> bool:
+        return self.verbosity.value >= Verbosity.VERBOSE.value
+
+    def is_very_verbose(self) -> bool:
+        return self.verbosity.value >= Verbosity.VERY_VERBOSE.value
+
+    def is_debug(self) -> bool:
+        return self.verbosity is Verbosity.DEBUG
+
+    def add_output(self, output: Output, background: bool = False) -> None:
+        """
+        Adds an output, written to from a BackgroundWriter thread
+        if background is True.
+        """
+        if background:
+            if self._writer is None:
+                self._writer = BackgroundWriter()
+                self._owns_writer = True
+
+            output = self._writer.wrap(output)
+
+        self._outputs.append(output)
+
+    def set_verbosity(self, verbosity: Verbosity) -> None:
+        for output in self._outputs:
+            output.set_verbosity(verbosity)
+
+    def is_decorated(self) -> bool:
+        return any(output.is_decorated() for output in self._outputs)
+
+    def decorated(self, decorated: bool = True) -> None:
+        for output in self._outputs:
+            output.decorated(decorated)
+
+    def supports_utf8(self) -> bool:
+        return all(output.supports_utf8() for output in self._outputs)
+
+    def write(
+        self,
+        messages: Messages,
+        new_line: bool = False,
+        verbosity: Verbosity = Verbosity.NORMAL,
+        type: Type = Type.NORMAL,
+    ) -> None:
+        outputs = self._get_outputs(verbosity)
+        if not outputs:
+            return
+
+        if callable(messages):
+            messages = messages()
+
+        # Messages are read once for all the outputs
+        messages = [messages] if isinstance(messages, str) else list(messages)
+
+        if type is Type.RAW:
+            for output in outputs:
+                output._write_raw(messages, new_line=new_line)
+
+            return
+
+        for group in self._group(outputs):
+            formatted = list(group[0]._format_messages(messages, type))
+            for output in group:
+                if len(formatted) == 1:
+                    output._write(formatted[0], new_line=new_line)
+                else:
+                    output._write_many(formatted, new_line=new_line)
+
+    def write_stream(
+        self,
+        chunks: Iterable[str],
+        new_line: bool = False,
+        verbosity: Verbosity = Verbosity.NORMAL,
+        type: Type = Type.NORMAL,
+    ) -> None:
+        outputs = self._get_outputs(verbosity)
+        if not outputs:
+            return
+
+        groups = [] if type is Type.RAW else self._group(outputs)
+        try:
+            for chunk in chunks:
+                if type is Type.RAW:
+                    for output in outputs:
+                        output._write(chunk)
+
+                for group in groups:
+                    message = group[0].formatter.feed(chunk)
+                    if message:
+                        for output in group:
+                            output._write_formatted(message, type)
+        finally:
+            for group in groups:
+                message = group[0].formatter.close()
+                if message:
+                    for output in group:
+                        output._write_formatted(message, type)
+
+        if new_line:
+            for output in outputs:
+                output._write("", new_line=True)
+
+    def flush(self) -> None:
+        """
+        Flushes every output, even if flushing one of them fails.
+        """
+        error: Exception | None = None
+        for output in self._outputs:
+            try:
+                output.flush()
+            except Exception as e:  # noqa: PERF203
+                error = error or e
+
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """
+        Flushes the outputs and stops the background writer,
+        if it was created by this output.
+        """
+        try:
+            self.flush()
+        finally:
+            if self._owns_writer and self._writer is not None:
+                self._writer.close()
+
+    def _format_message(self, message: str, type: Type) -> str:
+        if not self._outputs:
+            return super()._format_message(message, type)
+
+        return self._outputs[0]._format_message(message, type)
+
+    def _get_outputs(self, verbosity: Verbosity) -> list[Output]:
+        return [output for output in self._outputs if output.is_enabled(verbosity)]
+
+    def _group(self, outputs: list[Output]) -> list[list[Output]]:
+        """
+        Groups the outputs by decoration mode.
+        """
+        groups: dict[tuple[bool, bool, ColorDepth | None], list[Output]] = {}
+        for output in outputs:
+            formatter = output.formatter
+            groups.setdefault(
+                (
+                    formatter.is_decorated(),
+                    formatter.is_minimal_sgr(),
+                    formatter.color_depth,
+                ),
+                [],
+            ).append(output)
+
+        return list(groups.values())
+
+    def _write(self, message: str, new_line: bool = False) -> None:
+        for output in self._outputs:
+            output._write(message, new_line=new_line)
+
+    def _write_many(self, messages: Iterable[str], new_line: bool = False) -> None:
+        messages = list(messages)
+        for output in self._outputs:
+            output._write_many(messages, new_line=new_line)
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import inspect
 import os
+import signal
 import sys
+import threading
+import time
+import weakref
 
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import ClassVar
 from typing import NamedTuple
 
 
+if TYPE_CHECKING:
+    from types import FrameType
+
+
 class TerminalSize(NamedTuple):
     width: int
     height: int
@@ -65,3 +77,170 @@ class Terminal:
             width if self._width is None else self._width,
             height if self._height is None else self._height,
         )
+
+
+class TerminalGeometry:
+    """
+    Keeps the size of the terminal, so that it is not read again
+    every time it is needed.
+
+    The size is read again when the terminal is resized, on SIGWINCH
+    once watch_resizes() was called where available, and poll_interval
+    seconds after it was read otherwise, or when the COLUMNS or LINES
+    environment variables change.
+
+    Subscribers are called with the new size
+    the first time it is needed after a change.
+    """
+
+    _shared: ClassVar[TerminalGeometry | None] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self, terminal: Terminal | None = None, poll_interval: float = 0.5
+    ) -> None:
+        self._terminal = terminal or Terminal()
+        self._poll_interval = poll_interval
+        self._size: TerminalSize | None = None
+        self._environ: tuple[str | None, str | None] = (None, None)
+        self._read_time = 0.0
+        self._stale = True
+        self._subscribers: list[
+            Callable[[], Callable[[TerminalSize], None] | None]
+        ] = []
+        self._lock = threading.RLock()
+        self._resize_handler: Callable[[int, FrameType | None], None] | None = None
+
+    @classmethod
+    def shared(cls) -> TerminalGeometry:
+        """
+        Returns the geometry shared by all the components of the process.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+
+            return cls._shared
+
+    @property
+    def width(self) -> int:
+        return self.size.width
+
+    @property
+    def height(self) -> int:
+        return self.size.height
+
+    @property
+    def size(self) -> TerminalSize:
+        size = self._size
+        if (
+            size is None
+            or self._stale
+            or self._environ != (os.environ.get("COLUMNS"), os.environ.get("LINES"))
+            or (
+                time.monotonic() - self._read_time >= self._poll_interval
+                and not self._watches_resizes()
+            )
+        ):
+            size = self.refresh()
+
+        return size
+
+    def refresh(self) -> TerminalSize:
+        """
+        Reads the size of the terminal again,
+        calling the subscribers if it changed.
+        """
+        with self._lock:
+            self._stale = False
+            self._environ = (os.environ.get("COLUMNS"), os.environ.get("LINES"))
+            self._read_time = time.monotonic()
+
+            previous_size, self._size = self._size, self._terminal.size
+            if previous_size is not None and previous_size != self._size:
+                for callback in self._callbacks():
+                    callback(self._size)
+
+            return self._size
+
+    def subscribe(self, callback: Callable[[TerminalSize], None]) -> None:
+        """
+        Calls the given callback with the new size when the terminal is resized.
+
+        Bound methods are only kept as long as their object exists.
+        """
+        with self._lock:
+            reference: Callable[[], Callable[[TerminalSize], None] | None]
+            if inspect.ismethod(callback):
+                reference = weakref.WeakMethod(callback)
+            else:
+                reference = lambda: callback  # noqa: E731
+
+            self._subscribers.append(reference)
+
+    def unsubscribe(self, callback: Callable[[TerminalSize], None]) -> None:
+        with self._lock:
+            self._subscribers = [
+                reference
+                for reference in self._subscribers
+                if reference() not in (None, callback)
+            ]
+
+    def _callbacks(self) -> list[Callable[[TerminalSize], None]]:
+        callbacks = []
+        for reference in self._subscribers:
+            callback = reference()
+            if callback is not None:
+                callbacks.append(callback)
+
+        if len(callbacks) < len(self._subscribers):
+            self._subscribers = [
+                reference for reference in self._subscribers if reference() is not None
+            ]
+
+        return callbacks
+
+    def watch_resizes(self) -> bool:
+        """
+        Marks the size as stale when the terminal is resized,
+        rather than reading it again periodically.
+
+        Returns False if resizes cannot be watched.
+        """
+        if self._watches_resizes():
+            return True
+
+        sigwinch = getattr(signal, "SIGWINCH", None)
+        if sigwinch is None:
+            return False
+
+        def on_resize(signum: int, frame: FrameType | None) -> None:
+            # The size is read when it is needed,
+            # outside of the interrupted code.
+            self._stale = True
+
+            if callable(previous_handler):
+                previous_handler(signum, frame)
+
+        try:
+            previous_handler = signal.getsignal(sigwinch)
+            signal.signal(sigwinch, on_resize)
+        except (ValueError, OSError):
+            # Signal handlers can only be set from the main thread
+            return False
+
+        self._resize_handler = on_resize
+        # Resizes may have been missed until now
+        self._stale = True
+
+        return True
+
+    def _watches_resizes(self) -> bool:
+        """
+        Returns whether resizes are watched,
+        which stops once another handler replaces ours.
+        """
+        if self._resize_handler is None:
+            return False
+
+        return signal.getsignal(signal.SIGWINCH) is self._resize_handler
@@ -11,8 +11,9 @@ from typing import Match
 from cleo._utils import format_time
 from cleo.cursor import Cursor
 from cleo.io.io import IO
+from cleo.io.outputs.json_lines_output import JsonLinesOutput
 from cleo.io.outputs.section_output import SectionOutput
-from cleo.terminal import Terminal
+from cleo.terminal import TerminalGeometry
 from cleo.ui.component import Component
 
 
@@ -58,7 +59,8 @@ class ProgressBar(Component):
             io = io.error_output
 
         self._io = io
-        self._terminal = Terminal().size
+        self._terminal = TerminalGeometry.shared()
+        self._terminal.watch_resizes()
         self._max = 0
         self._step_width: int = 1
         self._set_max_steps(max)
@@ -227,13 +229,46 @@ class ProgressBar(Component):
 
         self.set_progress(self._max)
 
+        # The final state is drawn right away
+        if self._io.render_scheduler is not None:
+            self._io.render_scheduler.flush()
+
     def display(self) -> None:
         """
         Output the current progress string.
+
+        With a render scheduler, it is output with its next frame.
         """
         if self._io.is_quiet():
             return
 
+        if isinstance(self._io, JsonLinesOutput):
+            self._emit()
+
+            return
+
+        if self._io.render_scheduler is not None:
+            self._io.render_scheduler.schedule(self, self._display)
+
+            return
+
+        self._display()
+
+    def _emit(self) -> None:
+        assert isinstance(self._io, JsonLinesOutput)
+
+        record = {
+            "type": "progress",
+            "current": self._step,
+            "max": self._max or None,
+            "percent": self._formatter_percent() if self._max else None,
+        }
+        if self._messages:
+            record["messages"] = self._messages
+
+        self._io.emit(record)
+
+    def _display(self) -> None:
         if self._format is None:
             self._set_real_format(
                 self._internal_format or self._determine_best_format()
@@ -307,7 +342,7 @@ class ProgressBar(Component):
             if self._previous_message is not None:
                 if isinstance(self._io, SectionOutput):
                     lines_to_clear = (
-                        len(self._io.remove_format(message)) // self._terminal.width
+                        self._io.visible_width(message) // self._terminal.width
                         + self._format_line_count
                         + 1
                     )
@@ -357,7 +392,7 @@ class ProgressBar(Component):
             empty_bars = (
                 self.bar_width
                 - complete_bars
-                - len(self._io.remove_format(self.progress_char))
+                - self._io.visible_width(self.progress_char)
             )
             display += self.progress_char + self.empty_bar_char * int(empty_bars)
 
@@ -410,7 +445,7 @@ class ProgressBar(Component):
 
         # gets string length for each sub line with multiline format
         lines_length = [
-            len(self._io.remove_format(sub_line.rstrip("\r")))
+            self._io.visible_width(sub_line.rstrip("\r"))
             for sub_line in line.split("\n")
         ]
 
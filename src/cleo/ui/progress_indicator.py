@@ -161,6 +161,15 @@ class ProgressIndicator:
         if self._io.is_quiet():
             return
 
+        if self._io.render_scheduler is not None:
+            # Only the last state is drawn with the next frame
+            self._io.render_scheduler.schedule(self, self._draw)
+
+            return
+
+        self._draw()
+
+    def _draw(self) -> None:
         self._overwrite(
             re.sub(
                 r"(?i){([a-z\-_]+)(?::([^}]+))?}", self._overwrite_callback, self._fmt
@@ -229,6 +229,10 @@ class Question:
         stream = None
         if isinstance(io.error_output, StreamOutput):
             stream = io.error_output.stream
+
+        # The prompt is written to the error output
+        io.flush()
+
         return getpass.getpass("", stream=stream)
 
     def _validate_attempts(self, interviewer: Callable[[], Any], io: IO) -> Any:
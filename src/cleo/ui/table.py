@@ -13,6 +13,7 @@ from typing import Union
 from typing import cast
 
 from cleo.formatters.formatter import Formatter
+from cleo.io.outputs.json_lines_output import JsonLinesOutput
 from cleo.io.outputs.output import Output
 from cleo.ui.table_cell import TableCell
 from cleo.ui.table_cell_style import TableCellStyle
@@ -156,6 +157,12 @@ class Table:
         return self
 
     def render(self) -> None:
+        output = self._io if isinstance(self._io, Output) else self._io.output
+        if isinstance(output, JsonLinesOutput):
+            self._emit_rows(output)
+
+            return
+
         divider = TableSeparator()
 
         if self._horizontal:
@@ -234,6 +241,27 @@ class Table:
         self._cleanup()
         self._rendered = True
 
+    def _emit_rows(self, output: JsonLinesOutput) -> None:
+        """
+        Writes a record per row, whose cells are keyed by their header if any.
+        """
+        headers = (
+            [output.remove_format(header) for header in self._headers[0]]
+            if self._headers
+            else []
+        )
+        for row in self._rows:
+            if isinstance(row, TableSeparator):
+                continue
+
+            cells = [output.remove_format(cell) for cell in row]
+            output.emit(
+                {
+                    "type": "table_row",
+                    "row": dict(zip(headers, cells)) if headers else cells,
+                }
+            )
+
     def _render_row_separator(
         self,
         type: int = SEPARATOR_MID,
@@ -293,13 +321,13 @@ class Table:
         if title is not None:
             assert title_format is not None
             formatted_title = title_format.format(title)
-            title_length = len(self._io.remove_format(formatted_title))
+            title_length = self._io.visible_width(formatted_title)
             markup_length = len(markup)
             limit = markup_length - 4
 
             if title_length > limit:
                 title_length = limit
-                format_length = len(self._io.remove_format(title_format.format("")))
+                format_length = self._io.visible_width(title_format.format(""))
                 formatted_title = title_format.format(
                     title[: limit - format_length - 3] + "..."
                 )
@@ -372,7 +400,7 @@ class Table:
         if isinstance(cell, TableSeparator):
             return style.border_format.format(style.border_chars[2] * width)
 
-        width += len(cell) - len(self._io.remove_format(cell))
+        width += len(cell) - self._io.visible_width(cell)
         content = style.cell_row_content_format.format(cell)
 
         pad = style.pad
@@ -425,7 +453,7 @@ class Table:
 
                 if column in self._column_max_widths and self._column_max_widths[
                     column
-                ] < len(self._io.remove_format(cell)):
+                ] < self._io.visible_width(cell):
                     assert isinstance(self._io, Output)
                     cell = self._io.formatter.format_and_wrap(
                         cell, self._column_max_widths[column] * colspan
@@ -670,7 +698,7 @@ class Table:
 
         with suppress(IndexError):
             cell = row[column]
-            cell_width = len(self._io.remove_format(cell))
+            cell_width = self._io.visible_width(cell)
 
         column_width = self._column_widths.get(column, 0)
         cell_width = max(cell_width, column_width)
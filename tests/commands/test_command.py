@@ -6,6 +6,7 @@ from typing import ClassVar
 from cleo.application import Application
 from cleo.commands.command import Command
 from cleo.helpers import argument
+from cleo.io.outputs.output import Verbosity
 from cleo.testers.command_tester import CommandTester
 from tests.fixtures.inherited_command import ChildCommand
 from tests.fixtures.signature_command import SignatureCommand
@@ -31,6 +32,14 @@ class MyCommand(Command):
         self.write("Processing...")
         self.overwrite("Done!")
 
+    def _lazy(self) -> None:
+        self.line(lambda: "<info>Normal</info>")
+        self.line(self._fail, verbosity=Verbosity.DEBUG)
+        self.line_error(lambda: "Error", style="error")
+
+    def _fail(self) -> str:
+        raise AssertionError("Lazy messages are not built when not written")
+
 
 class MySecondCommand(Command):
     name = "test2"
@@ -87,3 +96,13 @@ def test_explicit_multiple_argument() -> None:
     tester.execute("1 2 3")
 
     assert tester.io.fetch_output() == "1,2,3\n"
+
+
+def test_lazy_line() -> None:
+    command = MyCommand()
+
+    tester = CommandTester(command)
+    tester.execute("lazy")
+
+    assert tester.io.fetch_output() == "Normal\n"
+    assert tester.io.fetch_error() == "Error\n"
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
+from cleo.color import ColorDepth
+from cleo.exceptions import CleoValueError
+from cleo.formatters.cache import CacheInfo
 from cleo.formatters.formatter import Formatter
+from cleo.formatters.style import Style
 
 
 @pytest.mark.parametrize(
@@ -101,3 +109,322 @@ def test_format_and_wrap_undecorated(text: str, width: int, expected: str) -> No
     formatter = Formatter(False)
 
     assert formatter.format_and_wrap(text, width) == expected
+
+
+@pytest.mark.parametrize(
+    ["text", "expected"],
+    [
+        ("foo<info>bar</info>", "foo\x1b[34mbar\x1b[39m"),
+        ("foo\\<info>bar\\</info>", "foo<info>bar</info>"),
+        ("<unknown>foo</>", "<unknown>foo"),
+        (
+            "<info>foo <error>bar</error> baz</>",
+            ("\x1b[34mfoo \x1b[39m\x1b[31;1mbar\x1b[39;22m\x1b[34m baz\x1b[39m"),
+        ),
+        ("foo\\", "foo\\"),
+    ],
+)
+def test_format(text: str, expected: str) -> None:
+    formatter = Formatter(True)
+
+    assert formatter.format(text) == expected
+
+
+def test_compile() -> None:
+    formatter = Formatter(True)
+    template = formatter.compile("<info>{}</info> {name:>5} <error>{count!r}</>")
+
+    assert template.render("foo", name="bar", count=3) == (
+        "\x1b[34mfoo\x1b[39m   bar \x1b[31;1m3\x1b[39;22m"
+    )
+    assert template.render("<error>x</error>\\", name="", count="y") == (
+        "\x1b[34m<error>x</error>\\\x1b[39m       \x1b[31;1m'y'\x1b[39;22m"
+    )
+
+    formatter.decorated(False)
+
+    assert template.render("foo", name="bar", count=3) == "foo   bar 3"
+
+
+def test_compile_matches_format() -> None:
+    formatter = Formatter(True)
+    template = formatter.compile("{{literal}} <c1>{0}</c1> \\<b>{1[0]}</b> {0}")
+
+    assert template.render("foo", ["bar"]) == formatter.format(
+        "{literal} <c1>foo</c1> \\<b>bar</b> foo"
+    )
+
+
+def test_compile_rejects_fields_inside_tags() -> None:
+    formatter = Formatter(True)
+    template = formatter.compile("<fg=red;{}>foo</>")
+
+    with pytest.raises(CleoValueError):
+        template.render("bar")
+
+
+def test_minimal_sgr() -> None:
+    formatter = Formatter(True)
+    formatter.minimal_sgr()
+
+    assert formatter.is_minimal_sgr()
+    assert (
+        formatter.format("<info>foo</info><comment>bar</comment> <info>baz</info>")
+        == "\033[34mfoo\033[32mbar\033[39m \033[34mbaz\033[39m"
+    )
+    assert (
+        formatter.format("<fg=red;options=bold>foo<fg=blue>bar</></>")
+        == "\033[31;1mfoo\033[34;22mbar\033[39m"
+    )
+
+
+@pytest.mark.parametrize("width", [0, 4, 10])
+def test_minimal_sgr_keeps_the_visible_text(width: int) -> None:
+    text = "<info>foo bar</info><comment>baz</comment> qux\n<error>quux</error>"
+    formatter = Formatter(True)
+    expected = formatter.format_and_wrap(text, width)
+
+    formatter.minimal_sgr()
+    output = formatter.format_and_wrap(text, width)
+
+    assert len(output) < len(expected)
+    assert formatter.remove_format(output) == formatter.remove_format(expected)
+
+
+def test_minimal_sgr_does_not_carry_styles_over_wrapped_lines() -> None:
+    formatter = Formatter(True)
+    formatter.minimal_sgr()
+
+    assert (
+        formatter.format_and_wrap("<info>foo bar</info><comment>baz</comment>", 4)
+        == "\033[34mfoo \033[39m\n\033[34mbar\033[32mb\033[39m\n\033[32maz\033[39m"
+    )
+
+
+def test_minimal_sgr_is_ignored_when_undecorated() -> None:
+    formatter = Formatter(False)
+    formatter.minimal_sgr()
+
+    assert formatter.format("<info>foo</info><comment>bar</comment>") == "foobar"
+
+
+def test_compile_is_invalidated_by_set_style() -> None:
+    formatter = Formatter(True)
+    template = formatter.compile("<foo>{}</foo>")
+
+    assert template.render("bar") == "<foo>bar"
+
+    formatter.set_style("foo", Style("green"))
+
+    assert template.render("bar") == "\x1b[32mbar\x1b[39m"
+
+
+def test_color_depth() -> None:
+    formatter = Formatter(True, cache_size=2)
+    formatter.set_style("foo", Style("#c0392b"))
+    formatter.set_color_depth(ColorDepth.ANSI_256)
+
+    assert formatter.format("<foo>bar</foo>") == "\x1b[38;5;130mbar\x1b[39m"
+    assert formatter.format("<fg=#f00>bar</>") == "\x1b[38;5;196mbar\x1b[39m"
+
+    formatter.set_color_depth(ColorDepth.TRUECOLOR)
+
+    assert formatter.format("<foo>bar</foo>") == "\x1b[38;2;192;57;43mbar\x1b[39m"
+
+    formatter.set_color_depth(ColorDepth.ANSI_16)
+
+    assert formatter.format("<foo>bar</foo>") == "\x1b[31mbar\x1b[39m"
+
+
+def test_cache() -> None:
+    formatter = Formatter(True, cache_size=2)
+
+    assert formatter.format("<info>foo</info>") == "\x1b[34mfoo\x1b[39m"
+    assert formatter.format("<info>foo</info>") == "\x1b[34mfoo\x1b[39m"
+    assert formatter.format_and_wrap("<info>foo</info>", 2) == (
+        "\x1b[34mfo\x1b[39m\n\x1b[34mo\x1b[39m"
+    )
+    assert formatter.format("<info>bar</info>") == "\x1b[34mbar\x1b[39m"
+
+    formatter.decorated(False)
+
+    assert formatter.format("<info>bar</info>") == "bar"
+    assert formatter.cache_info() == CacheInfo(
+        hits=1, misses=4, evictions=2, max_size=2, size=2
+    )
+
+    formatter.set_style("info", Style("red"))
+    formatter.decorated(True)
+
+    assert formatter.format("<info>bar</info>") == "\x1b[31mbar\x1b[39m"
+    assert formatter.cache_info() == CacheInfo(
+        hits=1, misses=5, evictions=2, max_size=2, size=1
+    )
+
+
+def test_cache_follows_style_changes() -> None:
+    formatter = Formatter(True, cache_size=2)
+    template = formatter.compile("<info>{}</info>")
+
+    assert formatter.format("<info>foo</info>") == "\x1b[34mfoo\x1b[39m"
+    assert template.render("foo") == "\x1b[34mfoo\x1b[39m"
+
+    formatter.style("info").foreground("red")
+
+    assert formatter.format("<info>foo</info>") == "\x1b[31mfoo\x1b[39m"
+    assert template.render("foo") == "\x1b[31mfoo\x1b[39m"
+
+
+def test_cache_ignores_other_styles() -> None:
+    formatter = Formatter(True, cache_size=2)
+
+    for _ in range(3):
+        formatter.format("<info>foo</info> <fg=red;options=nope>bar</>")
+        Style().foreground("red")
+
+    assert formatter.cache_info() == CacheInfo(
+        hits=2, misses=1, evictions=0, max_size=2, size=1
+    )
+
+
+def test_long_messages_are_not_cached() -> None:
+    formatter = Formatter(True, cache_size=2)
+    message = "<info>foo</info>" * Formatter.CACHE_MAX_LENGTH
+
+    assert (
+        formatter.format(message) == "\x1b[34mfoo\x1b[39m" * Formatter.CACHE_MAX_LENGTH
+    )
+    assert formatter.cache_info() == CacheInfo(0, 0, 0, 2, 0)
+
+
+@pytest.mark.parametrize("cache_size", [0, 10])
+def test_unclosed_tags_do_not_apply_to_the_next_messages(cache_size: int) -> None:
+    formatter = Formatter(True, cache_size=cache_size)
+
+    assert formatter.format("<info>foo") == "\x1b[34mfoo\x1b[39m"
+    assert formatter.format("bar</info>") == "bar"
+    assert formatter.format("<info>foo") == "\x1b[34mfoo\x1b[39m"
+
+
+def test_cache_is_disabled_by_default() -> None:
+    formatter = Formatter(True)
+
+    assert formatter.cache_info() is None
+
+    formatter.set_cache_size(1)
+
+    assert formatter.cache_info() == CacheInfo(0, 0, 0, 1, 0)
+
+
+@pytest.mark.parametrize("decorated", [False, True])
+def test_remove_format(decorated: bool) -> None:
+    formatter = Formatter(decorated)
+    text = "<info>foo</info> \\<bar> <baz>\x1b[31mqux\x1b[39m"
+
+    assert formatter.remove_format(text) == "foo <bar> <baz>qux"
+    assert formatter.remove_format(text) == "foo <bar> <baz>qux"
+    assert formatter.visible_width(text) == 18
+    assert formatter.is_decorated() is decorated
+
+
+def test_remove_format_does_not_change_the_current_style() -> None:
+    formatter = Formatter(True)
+
+    assert formatter.remove_format("<info>foo") == "foo"
+    assert formatter.format("bar") == "bar"
+
+
+def test_remove_format_is_invalidated_by_set_style() -> None:
+    formatter = Formatter(True)
+
+    assert formatter.remove_format("<foo>bar</>") == "<foo>bar"
+
+    formatter.set_style("foo", Style("green"))
+
+    assert formatter.remove_format("<foo>bar</>") == "bar"
+
+
+@pytest.mark.parametrize(
+    ["text", "width", "expected"],
+    [
+        ("日本語のテキスト", 4, "日本\n語の\nテキ\nスト"),
+        ("ab日本語", 3, "ab\n日\n本\n語"),
+        ("foo <info>日本</info> bar", 5, "foo \n日本 \nbar"),
+        ("ab\ncd <info>ef</info> gh", 5, "ab\ncd ef\ngh"),
+        ("👋 hello world", 6, "👋 hel\nlo wor\nld"),
+    ],
+)
+def test_format_and_wrap_wide_characters(text: str, width: int, expected: str) -> None:
+    formatter = Formatter(False)
+
+    assert formatter.format_and_wrap(text, width) == expected
+
+
+def test_visible_width_wide_characters() -> None:
+    formatter = Formatter(True)
+
+    assert formatter.visible_width("<info>日本語</info> ok") == 9
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        ["foo <info>bar</info> \\<baz> <error>qux</>"],
+        ["foo <in", "fo>bar</in", "fo> \\", "<baz> <error>q", "ux</", ">"],
+        list("foo <info>bar</info> \\<baz> <error>qux</>"),
+    ],
+)
+def test_feed(chunks: list[str]) -> None:
+    formatter = Formatter(False)
+
+    output = "".join(formatter.feed(chunk) for chunk in chunks) + formatter.close()
+
+    assert output == "foo bar <baz> qux"
+
+
+def test_feed_decorated() -> None:
+    formatter = Formatter(True)
+
+    assert formatter.feed("foo <inf") == "foo "
+    assert formatter.feed("o>bar") == "\x1b[34mbar\x1b[39m"
+    assert formatter.feed("</info> <") == " "
+    assert formatter.close() == "<"
+    assert formatter.format("baz") == "baz"
+
+
+def test_feed_gives_up_on_long_tags() -> None:
+    formatter = Formatter(False)
+    text = "<" + "a" * Formatter.STREAM_MAX_TAG_LENGTH
+
+    assert formatter.feed(text) == text
+    assert formatter.feed(">foo") == ">foo"
+    assert formatter.close() == ""
+
+
+@pytest.mark.parametrize("cache_size", [0, 16])
+def test_concurrent_format(cache_size: int) -> None:
+    messages = [
+        f"<info>{i} <fg=red;options=bold>foo <comment>bar</comment></>"
+        f" <bg=blue>baz {i % 7}</>\\<qux></info>"
+        for i in range(50)
+    ]
+    formatter = Formatter(True, cache_size=cache_size)
+    expected = [formatter.format(message) for message in messages]
+
+    def format_all(width: int) -> list[str]:
+        # Inline styles are resolved concurrently as well
+        formatter._inline_styles_cache.clear()
+
+        return [formatter.format_and_wrap(message, width) for message in messages]
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(format_all, [0, 10] * 40))
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    wrapped = [formatter.format_and_wrap(message, 10) for message in messages]
+    for i, result in enumerate(results):
+        assert result == (wrapped if i % 2 else expected)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pytest
+
+from cleo.exceptions import CleoValueError
+from cleo.formatters.style import Style
+from cleo.formatters.style_stack import StyleStack
+
+
+def test_pop_equivalent_style() -> None:
+    stack = StyleStack()
+    error = Style("red", options=["bold"])
+    info = Style("blue")
+
+    stack.push(error)
+    stack.push(info)
+
+    assert stack.pop(Style("red", options=["bold"])) is error
+    assert len(stack) == 0
+    assert stack.current.apply("foo") == "foo"
+
+
+def test_pop_invalid_style() -> None:
+    stack = StyleStack()
+    stack.push(Style("red"))
+
+    with pytest.raises(CleoValueError):
+        stack.pop(Style("blue"))
@@ -151,3 +151,39 @@ def test_parse_options(
     i.bind(Definition(options))
 
     assert i.options == expected_options
+
+
+@pytest.mark.parametrize(
+    ["args", "expected"],
+    [
+        (["cli.py", "--format=jsonl"], "jsonl"),
+        (["cli.py", "--format", "jsonl"], "jsonl"),
+        (["cli.py", "-fjsonl"], "jsonl"),
+        (["cli.py", "foo"], "text"),
+        (["cli.py", "--", "--format=jsonl"], "text"),
+        (["cli.py", "--format"], None),
+    ],
+)
+def test_parameter_option(args: list[str], expected: str | None) -> None:
+    input = ArgvInput(args)
+
+    assert input.parameter_option(["--format", "-f"], "text", True) == expected
+
+
+def test_parse_many_tokens() -> None:
+    files = [f"src/module_{i}.py" for i in range(10000)]
+    i = ArgvInput(["cli.py", "check", *files[:5000], "-e", "build", *files[5000:]])
+    definition = Definition(
+        [
+            Argument("command"),
+            Argument("files", is_list=True),
+            Option("--exclude", "-e", flag=False, is_list=True),
+        ]
+    )
+
+    # Binding again parses the tokens again
+    i.bind(definition)
+    i.bind(definition)
+
+    assert i.arguments == {"command": "check", "files": files}
+    assert i.options == {"exclude": ["build"]}
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+
+from cleo.io.buffered_io import BufferedIO
+from cleo.io.outputs.async_output import AsyncOutput
+from cleo.io.outputs.output import Verbosity
+from cleo.io.outputs.stream_output import Buffering
+from cleo.io.outputs.stream_output import StreamOutput
+
+
+def read_all(fd: int, chunks: list[bytes]) -> None:
+    while chunk := os.read(fd, 65536):
+        chunks.append(chunk)
+
+
+def test_write_to_pipe() -> None:
+    read_fd, write_fd = os.pipe()
+    output = StreamOutput(
+        os.fdopen(write_fd, "w", encoding="utf-8"), buffering=Buffering.BLOCK
+    )
+    async_output = AsyncOutput(output)
+    chunks: list[bytes] = []
+    reader = threading.Thread(target=read_all, args=(read_fd, chunks))
+
+    output.write_line("foo")
+
+    async def main() -> None:
+        await async_output.write_line("<info>bar</info>")
+        # Writing more than the pipe can hold does not block the event loop
+        writing = asyncio.ensure_future(async_output.write("é" * 1_000_000))
+        await asyncio.sleep(0.01)
+
+        assert not writing.done()
+
+        reader.start()
+        await writing
+        await async_output.write_line(["", "baz"])
+        await async_output.close()
+
+    asyncio.run(main())
+
+    assert async_output._transport is None
+    assert os.get_blocking(output.stream.fileno())
+
+    output.write_line("qux")
+    output.stream.close()
+    reader.join()
+    os.close(read_fd)
+
+    assert b"".join(chunks).decode() == "foo\nbar\n" + "é" * 1_000_000 + "\nbaz\nqux\n"
+
+
+def test_write_without_file_descriptor() -> None:
+    io = BufferedIO(decorated=True)
+    io.set_verbosity(Verbosity.VERBOSE)
+
+    async def main() -> None:
+        output = io.async_output()
+
+        assert io.async_output() is output
+
+        await output.write_line("<info>foo</info>")
+        await output.write_line("bar", verbosity=Verbosity.DEBUG)
+        await io.async_error_output().write("baz")
+        await output.close()
+
+    asyncio.run(main())
+
+    assert io.fetch_output() == "\x1b[34mfoo\x1b[39m\n"
+    assert io.fetch_error() == "baz"
+
+
+def test_detach() -> None:
+    read_fd, write_fd = os.pipe()
+    output = StreamOutput(os.fdopen(write_fd, "w", encoding="utf-8"))
+    async_output = AsyncOutput(output)
+
+    async def main() -> None:
+        await async_output.write_line("foo")
+
+    asyncio.run(main())
+
+    assert async_output._transport is not None
+    assert not os.get_blocking(write_fd)
+
+    async_output.detach()
+
+    assert async_output._transport is None
+    assert os.get_blocking(write_fd)
+
+    output.write_line("bar")
+    output.stream.close()
+
+    with os.fdopen(read_fd, "rb") as reader:
+        assert reader.read() == b"foo\nbar\n"
+
+
+def test_terminals_are_written_by_the_executor() -> None:
+    master_fd, slave_fd = os.openpty()
+    output = StreamOutput(os.fdopen(slave_fd, "w", encoding="utf-8"))
+    async_output = AsyncOutput(output)
+
+    async def main() -> None:
+        await async_output.write_line("foo")
+
+        assert async_output._transport is None
+        assert os.get_blocking(slave_fd)
+
+        await async_output.close()
+
+    asyncio.run(main())
+
+    output.stream.close()
+
+    assert os.read(master_fd, 1024) == b"foo\r\n"
+
+    os.close(master_fd)
+
+
+def test_streams_shared_with_standard_streams_are_written_by_the_executor() -> None:
+    read_fd, write_fd = os.pipe()
+    saved_fd = os.dup(0)
+    os.dup2(write_fd, 0)
+    try:
+        output = StreamOutput(os.fdopen(write_fd, "w", encoding="utf-8"))
+        async_output = AsyncOutput(output)
+
+        async def main() -> None:
+            await async_output.write_line("foo")
+
+            assert async_output._transport is None
+
+            await async_output.close()
+
+        asyncio.run(main())
+    finally:
+        os.dup2(saved_fd, 0)
+        os.close(saved_fd)
+
+    output.stream.close()
+
+    with os.fdopen(read_fd, "rb") as reader:
+        assert reader.read() == b"foo\n"
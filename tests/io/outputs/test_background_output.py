@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from cleo.io.outputs.background_output import BackgroundWriter
+from cleo.io.outputs.buffered_output import BufferedOutput
+from cleo.io.outputs.output import Output
+
+
+class LogOutput(Output):
+    def __init__(self, name: str, log: list[str]) -> None:
+        super().__init__()
+
+        self._name = name
+        self._log = log
+
+    def _write(self, message: str, new_line: bool = False) -> None:
+        self._log.append(f"{self._name}: {message}")
+
+
+def test_write() -> None:
+    writer = BackgroundWriter()
+    buffered = BufferedOutput(decorated=True)
+    output = writer.wrap(buffered)
+
+    output.write_line("<info>foo</info>")
+    output.write_line(["bar", "baz"])
+    output.flush()
+
+    assert buffered.fetch() == "\x1b[34mfoo\x1b[39m\nbar\nbaz\n"
+
+    writer.close()
+
+
+def test_ordering_across_outputs() -> None:
+    log: list[str] = []
+    writer = BackgroundWriter(max_size=4)
+    output = writer.wrap(LogOutput("output", log))
+    error_output = writer.wrap(LogOutput("error", log))
+
+    for i in range(50):
+        (error_output if i % 3 else output).write(str(i))
+
+    writer.close()
+
+    assert log == [f"{'error' if i % 3 else 'output'}: {i}" for i in range(50)]
+
+
+def test_backpressure() -> None:
+    log: list[str] = []
+    release = threading.Event()
+    output = LogOutput("output", log)
+    writer = BackgroundWriter(max_size=1)
+    background_output = writer.wrap(output)
+
+    writer.submit(release.wait)
+    background_output.write("foo")
+
+    thread = threading.Thread(target=background_output.write, args=("bar",))
+    thread.start()
+    thread.join(0.1)
+
+    # The queue is full while the writer thread is busy
+    assert thread.is_alive()
+
+    release.set()
+    thread.join()
+    writer.close()
+
+    assert log == ["output: foo", "output: bar"]
+
+
+def test_errors_are_raised_again() -> None:
+    def fail() -> None:
+        raise OSError("foo")
+
+    log: list[str] = []
+    writer = BackgroundWriter()
+    output = writer.wrap(LogOutput("output", log))
+
+    writer.submit(fail)
+    output.write("bar")
+
+    with pytest.raises(OSError, match="foo"):
+        writer.flush()
+
+    assert log == []
+
+    # Writes made once the error was raised are done
+    output.write("baz")
+    writer.flush()
+    writer.close()
+
+    assert log == ["output: baz"]
+
+
+def test_close_drains_pending_writes() -> None:
+    log: list[str] = []
+    writer = BackgroundWriter()
+    output = writer.wrap(LogOutput("output", log))
+
+    output.write([str(i) for i in range(10)])
+    writer.close()
+
+    assert log == [f"output: {i}" for i in range(10)]
+
+    # Writes after closing are done right away
+    output.write("foo")
+
+    assert log[-1] == "output: foo"
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+from cleo.io.outputs.buffered_output import BufferedOutput
+from cleo.io.outputs.output import Type
+from cleo.io.outputs.output import Verbosity
+
+
+def chunks() -> Iterator[str]:
+    yield "<comment>foo"
+    yield "</comment> <in"
+    yield "fo>bar</info>"
+
+
+def test_write_stream() -> None:
+    output = BufferedOutput(decorated=True)
+
+    output.write_stream(chunks(), new_line=True)
+
+    assert output.fetch() == "\x1b[32mfoo\x1b[39m \x1b[34mbar\x1b[39m\n"
+
+
+def test_write_stream_plain() -> None:
+    output = BufferedOutput()
+
+    output.write_stream(chunks(), type=Type.PLAIN)
+
+    assert output.fetch() == "foo bar"
+
+
+def test_write_stream_raw() -> None:
+    output = BufferedOutput(decorated=True)
+
+    output.write_stream(chunks(), type=Type.RAW)
+
+    assert output.fetch() == "<comment>foo</comment> <info>bar</info>"
+
+
+def test_write_stream_respects_verbosity() -> None:
+    output = BufferedOutput()
+
+    output.write_stream(chunks(), verbosity=Verbosity.VERBOSE)
+
+    assert output.fetch() == ""
+
+
+def test_write_many() -> None:
+    output = BufferedOutput(decorated=True)
+
+    output.write(("<info>foo</info>", "bar"), new_line=True)
+    output.write(iter(["<info>baz</info>"]), type=Type.RAW)
+
+    assert output.fetch() == "\x1b[34mfoo\x1b[39m\nbar\n<info>baz</info>"
+
+
+def test_max_memory_size() -> None:
+    output = BufferedOutput(max_memory_size=10)
+    section = output.section()
+
+    output.write_line([f"<info>{i}</info>" for i in range(100)])
+    section.write_line("foo")
+
+    assert output.tail(2) == "99\nfoo\n"
+    assert list(output.iter_lines())[:3] == ["0\n", "1\n", "2\n"]
+    assert output.fetch() == "".join(f"{i}\n" for i in range(100)) + "foo\n"
+    assert output.fetch() == ""
+
+
+def test_is_enabled() -> None:
+    output = BufferedOutput(verbosity=Verbosity.VERBOSE)
+
+    assert output.is_enabled(Verbosity.QUIET)
+    assert output.is_enabled(Verbosity.VERBOSE)
+    assert not output.is_enabled(Verbosity.DEBUG)
+
+    output.set_verbosity(Verbosity.DEBUG)
+
+    assert output.is_enabled(Verbosity.DEBUG)
+
+
+def test_write_lazy_messages() -> None:
+    output = BufferedOutput()
+    calls: list[Verbosity] = []
+
+    def messages(verbosity: Verbosity) -> list[str]:
+        calls.append(verbosity)
+
+        return [f"<info>{verbosity.name}</info>"]
+
+    output.write_line(lambda: messages(Verbosity.NORMAL))
+    output.write_line(lambda: messages(Verbosity.VERBOSE), verbosity=Verbosity.VERBOSE)
+
+    assert calls == [Verbosity.NORMAL]
+    assert output.fetch() == "NORMAL\n"
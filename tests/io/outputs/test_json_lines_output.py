@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+from cleo.io.outputs.buffered_output import BufferedOutput
+from cleo.io.outputs.json_lines_output import JsonLinesOutput
+from cleo.io.outputs.output import Type
+from cleo.io.outputs.output import Verbosity
+from cleo.io.outputs.stream_output import Buffering
+from cleo.io.outputs.stream_output import StreamOutput
+from cleo.ui.table import Table
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def test_write() -> None:
+    buffered = BufferedOutput(decorated=True)
+    output = JsonLinesOutput(buffered)
+
+    output.write_line("<info>foo</info>")
+    output.write("<comment>bar</comment> ")
+    output.write_line(["baz", "qux"])
+    output.write_line("<info>foo</info>", type=Type.RAW)
+
+    assert buffered.fetch() == (
+        '{"type":"line","text":"foo"}\n'
+        '{"type":"line","text":"bar baz"}\n'
+        '{"type":"line","text":"qux"}\n'
+        '{"type":"line","text":"<info>foo</info>"}\n'
+    )
+
+
+def test_flush_writes_the_pending_line() -> None:
+    buffered = BufferedOutput()
+    output = JsonLinesOutput(buffered)
+
+    output.write("foo")
+
+    assert buffered.fetch() == ""
+
+    output.flush()
+
+    assert buffered.fetch() == '{"type":"line","text":"foo"}\n'
+
+
+def test_emit() -> None:
+    buffered = BufferedOutput()
+    output = JsonLinesOutput(buffered)
+
+    output.emit({"type": "progress", "current": 1})
+    output.emit({"type": "progress", "current": 2}, verbosity=Verbosity.VERBOSE)
+    output.emit_line("<b>é</b>", style="info")
+
+    assert buffered.fetch() == (
+        '{"type":"progress","current":1}\n{"type":"line","text":"é","style":"info"}\n'
+    )
+
+
+def test_emit_escapes_characters_the_output_cannot_encode() -> None:
+    buffered = BufferedOutput(supports_utf8=False)
+    output = JsonLinesOutput(buffered)
+
+    output.emit_line("é")
+
+    assert buffered.fetch() == '{"type":"line","text":"\\u00e9"}\n'
+
+
+def test_escaped_tags_are_kept() -> None:
+    buffered = BufferedOutput()
+    output = JsonLinesOutput(buffered)
+
+    output.write_line("John \\<john@example.com>")
+    output.emit_line("<info>\\<z></info>")
+    table = Table(output)
+    table.set_headers(["Name"])
+    table.set_rows([["\\<z>"]])
+    table.render()
+
+    assert buffered.fetch() == (
+        '{"type":"line","text":"John <john@example.com>"}\n'
+        '{"type":"line","text":"<z>"}\n'
+        '{"type":"table_row","row":{"Name":"<z>"}}\n'
+    )
+
+
+def test_records_follow_the_buffering_of_the_output(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    path = tmp_path / "records"
+    writev = mocker.spy(os, "writev")
+    with path.open("w", encoding="utf-8") as stream:
+        output = JsonLinesOutput(StreamOutput(stream, buffering=Buffering.BLOCK))
+
+        for i in range(100):
+            output.emit_line(str(i))
+
+        assert path.read_text(encoding="utf-8") == ""
+
+        output.flush()
+
+    assert writev.call_count == 0
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 100
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import time
+
+from io import StringIO
+
+import pytest
+
+from cleo.exceptions import CleoValueError
+from cleo.io.outputs.render_scheduler import RenderScheduler
+from cleo.io.outputs.stream_output import Buffering
+from cleo.io.outputs.stream_output import StreamOutput
+from cleo.ui.progress_bar import ProgressBar
+from cleo.ui.progress_indicator import ProgressIndicator
+
+
+class Stream(StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.writes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+
+        return super().write(s)
+
+
+@pytest.fixture()
+def stream() -> Stream:
+    return Stream()
+
+
+@pytest.fixture()
+def output(stream: Stream) -> StreamOutput:
+    return StreamOutput(stream, decorated=True, buffering=Buffering.UNBUFFERED)
+
+
+def test_updates_are_drawn_in_frames(output: StreamOutput, stream: Stream) -> None:
+    scheduler = output.use_render_scheduler(fps=1)
+    section = output.section()
+    section2 = output.section()
+
+    section.write_line("Foo")
+
+    assert stream.getvalue() == "Foo\n"
+
+    for i in range(100):
+        section.overwrite(f"Foo {i}")
+        section2.overwrite(f"Bar {i}")
+
+    assert stream.getvalue() == "Foo\n"
+
+    scheduler.flush()
+
+    assert stream.getvalue() == "Foo\n\x1b[1A\r\x1b[2KFoo 99\x1b[1B\rBar 99\n"
+    assert stream.writes == 2
+
+
+def test_pending_updates_are_drawn_with_the_next_frame(
+    output: StreamOutput, stream: Stream
+) -> None:
+    output.use_render_scheduler(fps=20)
+    section = output.section()
+
+    for i in range(10):
+        section.overwrite(f"Foo {i}")
+
+    time.sleep(0.2)
+
+    assert stream.getvalue() == "Foo 0\n\x1b[1A\r\x1b[2KFoo 9\x1b[1B\r"
+    assert stream.writes == 2
+
+
+def test_pending_updates_are_drawn_before_writing(
+    output: StreamOutput, stream: Stream
+) -> None:
+    output.use_render_scheduler(fps=1)
+    section = output.section()
+
+    section.overwrite("Foo")
+    section.overwrite("Bar")
+    output.write_line("Baz")
+
+    assert stream.getvalue() == "Foo\n\x1b[1A\r\x1b[2KBar\x1b[1B\rBaz\n"
+
+
+def test_pending_updates_are_drawn_on_flush(
+    output: StreamOutput, stream: Stream
+) -> None:
+    output.use_render_scheduler(fps=1)
+    section = output.section()
+
+    section.overwrite("Foo")
+    section.overwrite("Bar")
+    output.flush()
+
+    assert stream.getvalue() == "Foo\n\x1b[1A\r\x1b[2KBar\x1b[1B\r"
+
+
+def test_progress_bar_draws_its_final_state(
+    output: StreamOutput, stream: Stream
+) -> None:
+    output.use_render_scheduler(fps=1)
+    bar = ProgressBar(output, 100, min_seconds_between_redraws=0)
+
+    bar.start()
+    for _ in range(100):
+        bar.advance()
+
+    bar.finish()
+
+    assert stream.writes == 2
+    assert stream.getvalue().endswith(" 100/100 [============================] 100%")
+
+
+def test_progress_indicator_draws_its_last_state(
+    output: StreamOutput, stream: Stream
+) -> None:
+    output.use_render_scheduler(fps=1)
+    indicator = ProgressIndicator(output, interval=0)
+
+    indicator.start("Starting...")
+    for _ in range(10):
+        indicator.advance()
+
+    indicator.finish("Done...")
+
+    assert stream.getvalue() == "\r\x1b[2K - Starting...\r\x1b[2K | Done...\n"
+
+
+def test_frame_rate_must_be_positive(output: StreamOutput) -> None:
+    with pytest.raises(CleoValueError):
+        RenderScheduler(output, fps=0)
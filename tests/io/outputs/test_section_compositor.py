@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+
+from cleo.io.outputs.section_compositor import SectionCompositor
+from cleo.io.outputs.section_output import SectionOutput
+from cleo.io.outputs.stream_output import StreamOutput
+from cleo.terminal import Terminal
+
+
+@pytest.fixture()
+def stream() -> StringIO:
+    return StringIO()
+
+
+@pytest.fixture()
+def sections() -> list[SectionOutput]:
+    return []
+
+
+@pytest.fixture()
+def compositor(sections: list[SectionOutput]) -> SectionCompositor:
+    return SectionCompositor(sections, Terminal(80, 6))
+
+
+@pytest.fixture()
+def output(
+    stream: StringIO, sections: list[SectionOutput], compositor: SectionCompositor
+) -> SectionOutput:
+    return SectionOutput(stream, sections, decorated=True, compositor=compositor)
+
+
+@pytest.fixture()
+def output2(
+    stream: StringIO, sections: list[SectionOutput], compositor: SectionCompositor
+) -> SectionOutput:
+    return SectionOutput(stream, sections, decorated=True, compositor=compositor)
+
+
+def test_write_appends_lines(output: SectionOutput, stream: StringIO) -> None:
+    output.write_line("Foo")
+    output.write_line("Bar\nBaz")
+
+    assert stream.getvalue() == "Foo\nBar\nBaz\n"
+
+
+def test_write_only_rewrites_changed_lines(
+    output: SectionOutput, output2: SectionOutput, stream: StringIO
+) -> None:
+    output.write_line("Foo\nBar")
+    output2.write_line("Baz")
+    stream.truncate(0)
+    stream.seek(0)
+
+    output.overwrite("Foo\nQux")
+
+    assert stream.getvalue() == "\x1b[2A\r\x1b[2KQux\x1b[2B\r"
+    assert output.content == "Foo\nQux\n"
+
+
+def test_write_redraws_lines_below_a_new_line(
+    output: SectionOutput, output2: SectionOutput, stream: StringIO
+) -> None:
+    output.write_line("Foo")
+    output2.write_line("Bar")
+    stream.truncate(0)
+    stream.seek(0)
+
+    output.write_line("Baz")
+
+    assert stream.getvalue() == "\x1b[1A\r\x1b[2KBaz\x1b[1B\rBar\n"
+
+
+def test_clear(output: SectionOutput, output2: SectionOutput, stream: StringIO) -> None:
+    output.write_line("Foo\nBar")
+    output2.write_line("Baz")
+    stream.truncate(0)
+    stream.seek(0)
+
+    output.clear(1)
+
+    assert stream.getvalue() == "\x1b[2A\r\x1b[2KBaz\x1b[1B\r\x1b[0J"
+    assert output.lines == 1
+
+
+def test_unchanged_content_is_not_written(
+    output: SectionOutput, stream: StringIO
+) -> None:
+    output.write_line("Foo")
+    stream.truncate(0)
+    stream.seek(0)
+
+    output.overwrite("Foo")
+
+    assert stream.getvalue() == ""
+
+
+def test_content_is_limited_to_the_terminal_height(
+    output: SectionOutput, output2: SectionOutput
+) -> None:
+    output.write_line("\n".join(str(i) for i in range(10)))
+    output2.write_line("Foo")
+
+    assert output.content == "5\n6\n7\n8\n9\n"
+    assert output.lines == 5
+    assert [line for line, _ in output.screen_lines()] == ["5", "6", "7", "8", "9"]
+
+
+def test_use_section_compositor(stream: StringIO) -> None:
+    output = StreamOutput(stream, decorated=True)
+    output.use_section_compositor()
+    section = output.section()
+
+    assert section.compositor is not None
+
+    output.use_section_compositor(False)
+
+    assert output.section().compositor is None
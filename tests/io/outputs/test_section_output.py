@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+
 from io import StringIO
 
 import pytest
@@ -109,3 +111,15 @@ def test_multiple_sections_output(
         stream.read()
         == "Foo\nBar\n\x1b[2A\x1b[0JBar\n\x1b[1A\x1b[0JBaz\nBar\n\x1b[1A\x1b[0JFoobar\n"
     )
+
+
+def test_lines_follow_the_terminal_width(output: SectionOutput, environ: None) -> None:
+    os.environ["COLUMNS"] = "10"
+    output.write_line("a" * 15)
+
+    assert output.lines == 2
+
+    os.environ["COLUMNS"] = "20"
+    output.write_line("b")
+
+    assert output.lines == 2
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+from cleo.io.outputs.spooled_buffer import SpooledBuffer
+
+
+CONTENT = "foo\nbär\n\nbaz\udcff\nqux"
+
+
+@pytest.fixture(params=[False, True], ids=["memory", "file"])
+def buffer(request: pytest.FixtureRequest) -> SpooledBuffer:
+    buffer = SpooledBuffer(10 if request.param else 1024)
+    for line in CONTENT.splitlines(keepends=True):
+        buffer.write(line)
+
+    assert buffer.is_spooled() is request.param
+
+    return buffer
+
+
+def test_getvalue(buffer: SpooledBuffer) -> None:
+    assert buffer.getvalue() == CONTENT
+
+    buffer.write("!")
+
+    assert buffer.getvalue() == CONTENT + "!"
+
+
+def test_iter_lines(buffer: SpooledBuffer) -> None:
+    assert list(buffer.iter_lines()) == CONTENT.splitlines(keepends=True)
+
+
+@pytest.mark.parametrize(
+    ["lines", "expected"],
+    [
+        (0, ""),
+        (1, "qux"),
+        (2, "baz\udcff\nqux"),
+        (5, CONTENT),
+        (10, CONTENT),
+    ],
+)
+def test_tail(buffer: SpooledBuffer, lines: int, expected: str) -> None:
+    assert buffer.tail(lines) == expected
+
+    buffer.write("\n")
+
+    assert buffer.tail(lines) == (expected + "\n" if lines else "")
+
+
+def test_clear(buffer: SpooledBuffer) -> None:
+    buffer.clear()
+
+    assert not buffer.is_spooled()
+    assert buffer.getvalue() == ""
+    assert list(buffer.iter_lines()) == []
+    assert buffer.tail(1) == ""
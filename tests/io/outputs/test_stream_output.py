@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import os
+import time
+
+from array import array
+from io import StringIO
+from typing import TYPE_CHECKING
+from typing import Iterator
+
+import pytest
+
+from cleo.color import ColorDepth
+from cleo.io.outputs.output import Type
+from cleo.io.outputs.stream_output import Buffering
+from cleo.io.outputs.stream_output import StreamOutput
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+class Stream(StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+
+        return super().write(s)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+def test_write_many() -> None:
+    stream = Stream()
+    output = StreamOutput(stream, buffering=Buffering.UNBUFFERED)
+    output.WRITE_CHUNK_SIZE = 100
+
+    output.write_line([f"<info>{i:>3}</info> foo" for i in range(100)])
+
+    assert stream.getvalue() == "".join(f"{i:>3} foo\n" for i in range(100))
+    assert stream.writes == 8
+    assert stream.flushes == 1
+
+
+def test_write_many_writes_messages_produced_before_an_error() -> None:
+    def messages() -> Iterator[str]:
+        yield "foo"
+        yield "bar"
+
+        raise RuntimeError("baz")
+
+    stream = Stream()
+    output = StreamOutput(stream, buffering=Buffering.UNBUFFERED)
+
+    with pytest.raises(RuntimeError):
+        output.write_line(messages())
+
+    assert stream.getvalue() == "foo\nbar\n"
+    assert stream.flushes == 1
+
+
+def test_color_depth_is_detected(environ: dict[str, str]) -> None:
+    os.environ["COLORTERM"] = ""
+    os.environ["TERM"] = "xterm-256color"
+
+    output = StreamOutput(Stream())
+
+    assert output.formatter.color_depth is ColorDepth.ANSI_256
+
+    os.environ["TERM"] = "xterm"
+
+    assert output.formatter.color_depth is ColorDepth.ANSI_256
+    assert output.section().formatter.color_depth is ColorDepth.ANSI_256
+
+
+def test_default_buffering() -> None:
+    class TTY(Stream):
+        def isatty(self) -> bool:
+            return True
+
+    assert StreamOutput(TTY()).buffering is Buffering.UNBUFFERED
+    assert StreamOutput(Stream()).buffering is Buffering.BLOCK
+
+
+def test_default_error_buffering(mocker: MockerFixture) -> None:
+    stream = mocker.patch("sys.stderr", Stream())
+
+    assert StreamOutput(stream).buffering is Buffering.LINE
+
+
+def test_outputs_sharing_a_file_with_the_errors_keep_their_order(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    path = tmp_path / "log"
+    with path.open("a", encoding="utf-8") as out, path.open(
+        "a", encoding="utf-8"
+    ) as err, (tmp_path / "other").open("a", encoding="utf-8") as other:
+        mocker.patch("sys.stderr", err)
+        output = StreamOutput(out)
+        error_output = StreamOutput(err)
+
+        assert output.buffering is Buffering.LINE
+        assert StreamOutput(other).buffering is Buffering.BLOCK
+
+        output.write_line("out 1")
+        error_output.write_line("err 2")
+        output.write_line("out 3")
+
+        assert path.read_text(encoding="utf-8") == "out 1\nerr 2\nout 3\n"
+
+
+@pytest.mark.parametrize(
+    ["buffering", "expected"],
+    [
+        (Buffering.UNBUFFERED, 3),
+        (Buffering.LINE, 2),
+        (Buffering.BLOCK, 0),
+    ],
+)
+def test_buffering(buffering: Buffering, expected: int) -> None:
+    stream = Stream()
+    output = StreamOutput(stream, buffering=buffering)
+
+    output.write_line("foo")
+    output.write("bar")
+    output.write(["baz", "qux\n"])
+
+    assert stream.getvalue() == "foo\nbarbazqux\n"
+    assert stream.flushes == expected
+
+
+def test_timed_buffering() -> None:
+    stream = Stream()
+    output = StreamOutput(stream, buffering=Buffering.TIMED, flush_interval=0.01)
+
+    output.write_line("foo")
+    output.write_line("bar")
+
+    assert stream.flushes == 0
+
+    time.sleep(0.1)
+
+    assert stream.flushes == 1
+
+    output.write_line("baz")
+    output.flush()
+    time.sleep(0.1)
+
+    assert stream.flushes == 2
+
+
+def test_write_raw_to_file_descriptor(tmp_path: Path) -> None:
+    with tmp_path.joinpath("output").open("w+", encoding="utf-8") as stream:
+        output = StreamOutput(stream, buffering=Buffering.BLOCK)
+        output.WRITE_CHUNK_SIZE = 10
+
+        output.write("<info>foo</info>")
+        output.write_line(["<bar>", "bäz"], type=Type.RAW)
+        output.write_bytes([b"qux", memoryview(b"quux"), bytearray(b"!")])
+        output.write_bytes(memoryview(array("b", b"hi")), new_line=True)
+        output.flush()
+
+        assert tmp_path.joinpath("output").read_text(encoding="utf-8") == (
+            "foo<bar>\nbäz\nquxquux!hi\n"
+        )
+
+
+def test_write_raw_without_file_descriptor() -> None:
+    stream = Stream()
+    output = StreamOutput(stream)
+
+    output.write_line(["<bar>", "bäz"], type=Type.RAW)
+    output.write_bytes(b"qux")
+
+    assert stream.getvalue() == "<bar>\nbäz\nqux"
+
+
+def test_write_raw_encoding_errors(tmp_path: Path) -> None:
+    with tmp_path.joinpath("output").open("w", encoding="ascii") as stream:
+        output = StreamOutput(stream, encoding_errors="replace")
+
+        output.write("bäz", type=Type.RAW)
+
+    assert tmp_path.joinpath("output").read_text() == "b?z"
+
+
+@pytest.mark.skipif(not hasattr(os, "writev"), reason="writev() is not available")
+def test_write_many_buffers(mocker: MockerFixture) -> None:
+    read_fd, write_fd = os.pipe()
+    writev = mocker.spy(os, "writev")
+    with os.fdopen(write_fd, "w") as stream:
+        output = StreamOutput(stream)
+        output.write_line([str(i) for i in range(3000)], type=Type.RAW)
+
+    with os.fdopen(read_fd) as result:
+        assert result.read() == "".join(f"{i}\n" for i in range(3000))
+
+    assert writev.call_count == 6
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import threading
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cleo.io.outputs.buffered_output import BufferedOutput
+from cleo.io.outputs.output import Output
+from cleo.io.outputs.output import Type
+from cleo.io.outputs.output import Verbosity
+from cleo.io.outputs.tee_output import TeeOutput
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+class BlockedOutput(BufferedOutput):
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.released = threading.Event()
+
+    def _write(self, message: str, new_line: bool = False) -> None:
+        self.released.wait()
+
+        super()._write(message, new_line=new_line)
+
+
+class FailingOutput(Output):
+    def _write(self, message: str, new_line: bool = False) -> None:
+        pass
+
+    def flush(self) -> None:
+        raise OSError("Cannot flush")
+
+
+def test_write(mocker: MockerFixture) -> None:
+    terminal = BufferedOutput(decorated=True)
+    terminal2 = BufferedOutput(decorated=True)
+    log = BufferedOutput()
+    format = mocker.spy(terminal.formatter, "format")
+    format2 = mocker.spy(terminal2.formatter, "format")
+    output = TeeOutput([terminal, terminal2, log])
+
+    output.write_line("<info>foo</info>")
+    output.write_line(["bar", "<comment>baz</comment>"])
+
+    assert terminal.fetch() == "\x1b[34mfoo\x1b[39m\nbar\n\x1b[32mbaz\x1b[39m\n"
+    assert terminal2.fetch() == "\x1b[34mfoo\x1b[39m\nbar\n\x1b[32mbaz\x1b[39m\n"
+    assert log.fetch() == "foo\nbar\nbaz\n"
+    assert format.call_count == 3
+    assert format2.call_count == 0
+
+
+def test_write_raw() -> None:
+    terminal = BufferedOutput(decorated=True)
+    log = BufferedOutput()
+    output = TeeOutput([terminal, log])
+
+    output.write_line("<info>foo</info>", type=Type.RAW)
+
+    assert terminal.fetch() == "<info>foo</info>\n"
+    assert log.fetch() == "<info>foo</info>\n"
+
+
+def test_write_stream() -> None:
+    terminal = BufferedOutput(decorated=True)
+    log = BufferedOutput()
+    output = TeeOutput([terminal, log])
+
+    output.write_stream(["<in", "fo>foo</", "info>"], new_line=True)
+
+    assert terminal.fetch() == "\x1b[34mfoo\x1b[39m\n"
+    assert log.fetch() == "foo\n"
+
+
+def test_verbosity() -> None:
+    terminal = BufferedOutput()
+    log = BufferedOutput(verbosity=Verbosity.DEBUG)
+    output = TeeOutput([terminal, log])
+
+    assert output.verbosity is Verbosity.DEBUG
+    assert output.is_verbose()
+    assert output.is_debug()
+    assert not output.is_quiet()
+
+    output.write_line("foo")
+    output.write_line("bar", verbosity=Verbosity.VERBOSE)
+
+    assert terminal.fetch() == "foo\n"
+    assert log.fetch() == "foo\nbar\n"
+
+
+def test_formatter_is_the_one_of_the_first_output() -> None:
+    terminal = BufferedOutput(decorated=True)
+    output = TeeOutput([terminal, BufferedOutput()])
+
+    assert output.formatter is terminal.formatter
+    assert output.compile("<info>{}</info>").render("foo") == "\x1b[34mfoo\x1b[39m"
+    assert output.visible_width("<info>foo</info>") == 3
+
+
+def test_background_outputs_do_not_hold_up_the_others() -> None:
+    terminal = BufferedOutput()
+    log = BlockedOutput()
+    output = TeeOutput([terminal])
+    output.add_output(log, background=True)
+
+    output.write_line("foo")
+    output.write_line("bar")
+
+    assert terminal.fetch() == "foo\nbar\n"
+    assert log.fetch() == ""
+
+    log.released.set()
+    output.close()
+
+    assert log.fetch() == "foo\nbar\n"
+
+
+def test_flush_flushes_every_output(mocker: MockerFixture) -> None:
+    terminal = BufferedOutput()
+    flush = mocker.spy(terminal, "flush")
+    output = TeeOutput([FailingOutput(), terminal])
+
+    with pytest.raises(OSError, match="Cannot flush"):
+        output.flush()
+
+    assert flush.call_count == 1
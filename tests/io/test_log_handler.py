@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import logging
+
+from typing import Iterator
+
+import pytest
+
+from cleo.io.log_handler import LogHandler
+from cleo.io.outputs.buffered_output import BufferedOutput
+from cleo.io.outputs.json_lines_output import JsonLinesOutput
+from cleo.io.outputs.output import Verbosity
+
+
+@pytest.fixture()
+def logger() -> Iterator[logging.Logger]:
+    logger = logging.getLogger("tests.log_handler")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+
+    yield logger
+
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_write_records(logger: logging.Logger) -> None:
+    output = BufferedOutput(decorated=True)
+    handler = LogHandler(output)
+    logger.addHandler(handler)
+    handler.start()
+
+    logger.error("Failed <%s>", "foo")
+    logger.warning("Warning")
+    logger.info("Info")
+
+    handler.flush()
+
+    assert output.fetch() == (
+        "\x1b[31;1mFailed <foo>\x1b[39;22m\n\x1b[32mWarning\x1b[39m\n"
+    )
+
+
+@pytest.mark.parametrize(
+    ["verbosity", "expected"],
+    [
+        (Verbosity.QUIET, ""),
+        (Verbosity.NORMAL, "Warning\n"),
+        (Verbosity.VERBOSE, "Warning\nInfo\n"),
+        (Verbosity.VERY_VERBOSE, "Warning\nInfo\n"),
+        (Verbosity.DEBUG, "Warning\nInfo\nDebug\n"),
+    ],
+)
+def test_verbosity_sets_the_level(
+    logger: logging.Logger, verbosity: Verbosity, expected: str
+) -> None:
+    output = BufferedOutput(verbosity=verbosity)
+    handler = LogHandler(output, verbosity=verbosity)
+    logger.addHandler(handler)
+    handler.start()
+
+    logger.warning("Warning")
+    logger.info("Info")
+    logger.debug("Debug")
+
+    handler.flush()
+
+    assert output.fetch() == expected
+
+
+def test_records_are_written_by_the_listener(logger: logging.Logger) -> None:
+    output = BufferedOutput()
+    handler = LogHandler(output)
+    logger.addHandler(handler)
+
+    logger.warning("Queued")
+
+    assert output.fetch() == ""
+
+    handler.start()
+    handler.stop()
+
+    assert output.fetch() == "Queued\n"
+
+
+def test_records_are_formatted_when_emitted(logger: logging.Logger) -> None:
+    output = BufferedOutput()
+    handler = LogHandler(output)
+    logger.addHandler(handler)
+
+    items = ["foo"]
+    logger.warning("Items: %s", items)
+    items.append("bar")
+
+    try:
+        raise ValueError("Invalid")
+    except ValueError:
+        logger.exception("Failed")
+
+    handler.start()
+    handler.stop()
+
+    lines = output.fetch().splitlines()
+
+    assert lines[0] == "Items: ['foo']"
+    assert lines[1] == "Failed"
+    assert lines[2] == "Traceback (most recent call last):"
+    assert lines[-1] == "ValueError: Invalid"
+
+
+def test_write_json_lines_records(logger: logging.Logger) -> None:
+    output = BufferedOutput()
+    handler = LogHandler(JsonLinesOutput(output))
+    logger.addHandler(handler)
+    handler.start()
+
+    logger.warning("Warning <%s>", "foo")
+
+    handler.flush()
+
+    assert json.loads(output.fetch()) == {
+        "type": "log",
+        "level": "WARNING",
+        "logger": "tests.log_handler",
+        "message": "Warning <foo>",
+    }
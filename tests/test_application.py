@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
 import os
 import sys
 
+from io import StringIO
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -11,7 +16,9 @@ from cleo.application import Application
 from cleo.commands.command import Command
 from cleo.exceptions import CleoCommandNotFoundError
 from cleo.exceptions import CleoNamespaceNotFoundError
+from cleo.exceptions import CleoUserError
 from cleo.io.io import IO
+from cleo.io.outputs.stream_output import Buffering
 from cleo.io.outputs.stream_output import StreamOutput
 from cleo.testers.application_tester import ApplicationTester
 from tests.fixtures.foo1_command import Foo1Command
@@ -23,6 +30,10 @@ from tests.fixtures.foo_sub_namespaced2_command import FooSubNamespaced2Command
 from tests.fixtures.foo_sub_namespaced3_command import FooSubNamespaced3Command
 
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
 FIXTURES_PATH = Path(__file__).parent.joinpath("fixtures")
 
 
@@ -380,3 +391,203 @@ def test_run_with_input_and_non_interactive(cmd: Command) -> None:
 
     assert status_code == 0
     assert tester.io.fetch_output() == "default input\n"
+
+
+def test_run_detaches_async_outputs(app: Application, argv: list[str]) -> None:
+    class AsyncCommand(Command):
+        name = "async"
+
+        def handle(self) -> int:
+            async def main() -> None:
+                await self.io.async_output().write_line("foo")
+
+            asyncio.run(main())
+
+            return 0
+
+    app.auto_exits(False)
+    app.add(AsyncCommand())
+    read_fd, write_fd = os.pipe()
+    output = StreamOutput(os.fdopen(write_fd, "w", encoding="utf-8"))
+
+    sys.argv = ["console", "async"]
+    app.run(output=output)
+
+    assert os.get_blocking(write_fd)
+
+    output.stream.close()
+    with os.fdopen(read_fd, "rb") as reader:
+        assert reader.read() == b"foo\n"
+
+
+@pytest.mark.parametrize("error", [RuntimeError, KeyboardInterrupt, BrokenPipeError])
+def test_run_flushes_outputs(
+    app: Application,
+    argv: list[str],
+    mocker: MockerFixture,
+    error: type[BaseException],
+) -> None:
+    class FailingCommand(Command):
+        name = "fail"
+
+        def handle(self) -> int:
+            self.line("foo")
+            self.line_error("bar")
+
+            raise error
+
+    app.auto_exits(False)
+    app.add(FailingCommand())
+    output = StreamOutput(StringIO(), buffering=Buffering.BLOCK)
+    error_output = StreamOutput(StringIO(), buffering=Buffering.BLOCK)
+    flushes = []
+    output.flush = lambda: flushes.append("output")  # type: ignore[method-assign]
+    error_output.flush = lambda: flushes.append("error")  # type: ignore[method-assign]
+
+    mocker.patch("os.dup2")
+
+    sys.argv = ["console", "fail"]
+    app.run(output=output, error_output=error_output)
+
+    assert flushes == ["output", "error"]
+
+
+@pytest.mark.parametrize(
+    ["args", "expected"],
+    [
+        ("", "Warning\n"),
+        ("-v", "Warning\nInfo\n"),
+        ("-vvv", "Warning\nInfo\nDebug\n"),
+        ("-q", ""),
+    ],
+)
+def test_run_with_logging(app: Application, args: str, expected: str) -> None:
+    logger = logging.getLogger("tests.application")
+    logger.propagate = False
+
+    class LogCommand(Command):
+        name = "log"
+
+        def handle(self) -> int:
+            logger.warning("Warning")
+            logger.info("Info")
+            logger.debug("Debug")
+
+            return 0
+
+    app.add(LogCommand())
+    handler = app.use_logging(logger)
+    tester = ApplicationTester(app)
+
+    try:
+        assert tester.execute(f"log {args}") == 0
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    assert tester.io.fetch_output() == ""
+    assert tester.io.fetch_error() == expected
+
+
+def test_run_with_logging_to_the_root_logger(app: Application) -> None:
+    root = logging.getLogger()
+    root_level = root.level
+    logger = logging.getLogger("tests.root_logger")
+
+    class LogCommand(Command):
+        name = "log"
+
+        def handle(self) -> int:
+            logger.info("Info")
+            logger.debug("Debug")
+
+            return 0
+
+    app.add(LogCommand())
+    handler = app.use_logging()
+    tester = ApplicationTester(app)
+
+    try:
+        assert tester.execute("log -vvv") == 0
+    finally:
+        root.removeHandler(handler)
+        handler.close()
+
+    assert tester.io.fetch_error() == "Info\nDebug\n"
+    assert root.level == root_level
+
+
+def test_run_with_logging_keeps_lower_logger_levels(app: Application) -> None:
+    root = logging.getLogger()
+    root_level = root.level
+    logger = logging.getLogger("tests.application.debug")
+    logger.setLevel(logging.DEBUG)
+
+    class NoopCommand(Command):
+        name = "noop"
+
+        def handle(self) -> int:
+            return 0
+
+    app.add(NoopCommand())
+    root_handler = app.use_logging()
+    handler = app.use_logging(logger)
+    tester = ApplicationTester(app)
+
+    try:
+        assert tester.execute("noop") == 0
+    finally:
+        root.removeHandler(root_handler)
+        logger.removeHandler(handler)
+        handler.close()
+
+    assert root.level == root_level
+    assert logger.level == logging.DEBUG
+    assert handler.level == logging.WARNING
+
+
+def test_run_with_invalid_output_format(app: Application) -> None:
+    app.add(FooCommand())
+    tester = ApplicationTester(app)
+
+    assert tester.execute("foo:bar --output-format=json") == 1
+    assert tester.io.fetch_output() == ""
+    assert (
+        'Invalid output format "json", expected one of: text, jsonl'
+        in tester.io.fetch_error()
+    )
+
+
+def test_run_with_json_lines_output(app: Application) -> None:
+    class ReportCommand(Command):
+        name = "report"
+
+        def handle(self) -> int:
+            self.info("Checking <comment>packages</comment>")
+            self.line("Done")
+            table = self.table(rows=[["cleo", "2.0"], ["foo", "1.0"]])
+            table.set_headers(["Name", "Version"])
+            table.render()
+
+            bar = self.progress_bar(2)
+            bar.start()
+            bar.advance(2)
+            bar.finish()
+
+            raise CleoUserError("Failed")
+
+    app.add(ReportCommand())
+    tester = ApplicationTester(app)
+
+    assert tester.execute("report --output-format=jsonl") == 1
+    assert [json.loads(line) for line in tester.io.fetch_output().splitlines()] == [
+        {"type": "line", "text": "Checking packages", "style": "info"},
+        {"type": "line", "text": "Done"},
+        {"type": "table_row", "row": {"Name": "cleo", "Version": "2.0"}},
+        {"type": "table_row", "row": {"Name": "foo", "Version": "1.0"}},
+    ]
+    assert [json.loads(line) for line in tester.io.fetch_error().splitlines()] == [
+        {"type": "progress", "current": 0, "max": 2, "percent": 0},
+        {"type": "progress", "current": 2, "max": 2, "percent": 100},
+        {"type": "error", "error": "CleoUserError", "message": "Failed"},
+    ]
@@ -5,6 +5,7 @@ import os
 import pytest
 
 from cleo.color import Color
+from cleo.color import ColorDepth
 
 
 @pytest.mark.parametrize(
@@ -56,7 +57,74 @@ def test_degrade_true_colors(
     environ: dict[str, str],
 ) -> None:
     os.environ["COLORTERM"] = ""
+    os.environ["TERM"] = "xterm"
 
     color = Color(foreground, background, options)
 
     assert color.apply(" ") == expected
+
+
+@pytest.mark.parametrize(
+    ["foreground", "background", "expected"],
+    [
+        ("#f00", "#ff0", "\033[38;5;196;48;5;226m \033[39;49m"),
+        ("#c0392b", "#f1c40f", "\033[38;5;130;48;5;220m \033[39;49m"),
+        ("#808080", "#eee", "\033[38;5;244;48;5;255m \033[39;49m"),
+        ("#000", "#fff", "\033[38;5;16;48;5;231m \033[39;49m"),
+    ],
+)
+def test_256_colors(foreground: str, background: str, expected: str) -> None:
+    color = Color(foreground, background, depth=ColorDepth.ANSI_256)
+
+    assert color.apply(" ") == expected
+
+
+@pytest.mark.parametrize(
+    ["colorterm", "term", "expected"],
+    [
+        ("truecolor", "xterm", ColorDepth.TRUECOLOR),
+        ("24bit", "xterm-256color", ColorDepth.TRUECOLOR),
+        ("", "xterm-256color", ColorDepth.ANSI_256),
+        ("", "xterm", ColorDepth.ANSI_16),
+    ],
+)
+def test_color_depth_from_environment(
+    colorterm: str, term: str, expected: ColorDepth, environ: dict[str, str]
+) -> None:
+    os.environ["COLORTERM"] = colorterm
+    os.environ["TERM"] = term
+
+    assert ColorDepth.from_environment() is expected
+
+
+def test_intern() -> None:
+    color = Color.intern("red", "yellow", ["underline"])
+
+    assert Color.intern("red", "yellow", ("underline",)) is color
+    assert Color.intern("red", "yellow") is not color
+    assert color == Color("red", "yellow", ["underline"])
+    assert hash(color) == hash(Color("red", "yellow", ["underline"]))
+    assert color.set() == "\033[31;43;4m"
+    assert color.unset() == "\033[39;49;24m"
+
+
+@pytest.mark.parametrize(
+    ["source", "target", "expected"],
+    [
+        (Color("red"), Color("red"), ""),
+        (Color("red"), Color("blue"), "\033[34m"),
+        (Color("red", "yellow"), Color(), "\033[39;49m"),
+        (Color(), Color("red", options=["underline"]), "\033[31;4m"),
+        (Color(options=["bold", "underline"]), Color(options=["bold"]), "\033[24m"),
+        # Bold and dark share their unset code
+        (Color(options=["bold"]), Color(options=["dark"]), "\033[22;2m"),
+        (Color(options=["bold", "dark"]), Color(options=["dark"]), "\033[22;2m"),
+    ],
+)
+def test_transition(source: Color, target: Color, expected: str) -> None:
+    assert source.transition(target) == expected
+
+    assert Color.intern("#f00", depth=ColorDepth.ANSI_256) is Color.intern(
+        "#f00", depth=ColorDepth.ANSI_256
+    )
+    assert Color.intern("red", depth=ColorDepth.ANSI_256) is Color.intern("red")
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import os
+import signal
+import weakref
 
 from typing import TYPE_CHECKING
 
 import pytest
 
 from cleo.terminal import Terminal
+from cleo.terminal import TerminalGeometry
+from cleo.terminal import TerminalSize
 
 
 if TYPE_CHECKING:
@@ -55,3 +59,110 @@ def test_lines_env(
     mocker.patch.dict(os.environ, {"LINES": lines_env_value}, clear=False)
     console = Terminal(height=init_value)
     assert console.height == expected
+
+
+def test_geometry_caches_the_size(mocker: MockerFixture) -> None:
+    terminal = Terminal(width=99, height=101)
+    get_size = mocker.spy(terminal, "_get_terminal_size")
+    geometry = TerminalGeometry(terminal, poll_interval=60)
+
+    assert geometry.size == (99, 101)
+    assert geometry.width == 99
+    assert geometry.height == 101
+    assert get_size.call_count == 1
+
+
+def test_geometry_follows_environment(mocker: MockerFixture) -> None:
+    mocker.patch.dict(os.environ, {"COLUMNS": "100", "LINES": "30"})
+    geometry = TerminalGeometry(poll_interval=60)
+    sizes: list[TerminalSize] = []
+    geometry.subscribe(sizes.append)
+
+    assert geometry.size == (100, 30)
+
+    os.environ["COLUMNS"] = "120"
+
+    assert geometry.size == (120, 30)
+    assert sizes == [(120, 30)]
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="No SIGWINCH")
+def test_geometry_is_refreshed_on_resize(mocker: MockerFixture) -> None:
+    geometry = TerminalGeometry(poll_interval=60)
+    geometry.watch_resizes()
+    size = geometry.size
+
+    get_size = mocker.spy(Terminal, "_get_terminal_size")
+
+    assert geometry.size == size
+    assert get_size.call_count == 0
+
+    os.kill(os.getpid(), signal.SIGWINCH)
+
+    assert geometry.size == size
+    assert get_size.call_count == 1
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="No SIGWINCH")
+def test_geometry_only_watches_resizes_when_asked(mocker: MockerFixture) -> None:
+    handler = signal.getsignal(signal.SIGWINCH)
+    geometry = TerminalGeometry(poll_interval=0)
+
+    assert signal.getsignal(signal.SIGWINCH) is handler
+
+    try:
+        assert geometry.watch_resizes()
+        assert signal.getsignal(signal.SIGWINCH) is not handler
+    finally:
+        signal.signal(signal.SIGWINCH, handler)
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="No SIGWINCH")
+def test_geometry_polls_once_its_handler_is_replaced(mocker: MockerFixture) -> None:
+    handler = signal.getsignal(signal.SIGWINCH)
+    geometry = TerminalGeometry(poll_interval=0)
+    geometry.watch_resizes()
+    assert geometry.size
+
+    get_size = mocker.spy(Terminal, "_get_terminal_size")
+    try:
+        assert geometry.size
+
+        assert get_size.call_count == 0
+
+        signal.signal(signal.SIGWINCH, signal.SIG_DFL)
+        assert geometry.size
+
+        assert get_size.call_count == 1
+    finally:
+        signal.signal(signal.SIGWINCH, handler)
+
+
+def test_geometry_does_not_keep_subscribed_objects(mocker: MockerFixture) -> None:
+    class Subscriber:
+        def __init__(self) -> None:
+            self.sizes: list[TerminalSize] = []
+
+        def resized(self, size: TerminalSize) -> None:
+            self.sizes.append(size)
+
+    mocker.patch.dict(os.environ, {"COLUMNS": "100", "LINES": "30"})
+    geometry = TerminalGeometry(poll_interval=60)
+    subscriber = Subscriber()
+    geometry.subscribe(subscriber.resized)
+
+    assert geometry.width == 100
+
+    os.environ["COLUMNS"] = "120"
+
+    assert geometry.width == 120
+    assert subscriber.sizes == [(120, 30)]
+
+    reference = weakref.ref(subscriber)
+    del subscriber
+
+    assert reference() is None
+
+    os.environ["COLUMNS"] = "140"
+
+    assert geometry.width == 140
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pytest
 
+from cleo._utils import display_width
 from cleo._utils import find_similar_names
 from cleo._utils import format_time
 from cleo._utils import strip_tags
@@ -43,7 +44,32 @@ def test_find_similar_names(name: str, expected: list[str]) -> None:
 
 
 @pytest.mark.parametrize(
-    "value, expected", (("<ab> cde</>", " cde"), ("<ab", "<ab"), ("cd>", "cd>"))
+    "value, expected",
+    (
+        ("<ab> cde</>", " cde"),
+        ("<ab", "<ab"),
+        ("cd>", "cd>"),
+        ("<info>foo</info> &amp; <fg=red;options=bold>bar</>", "foo &amp; bar"),
+        ("a < b <c", "a < b <c"),
+        ("<1> <a <b>c", "<1> <a c"),
+    ),
 )
 def test_strip_tags(value: str, expected: str) -> None:
     assert strip_tags(value) == expected
+
+
+@pytest.mark.parametrize(
+    ["text", "expected"],
+    [
+        ("", 0),
+        ("foo", 3),
+        ("Père", 4),
+        ("Père", 4),
+        ("日本語", 6),
+        ("한국어", 6),
+        ("👋 hello", 8),
+        ("a\u200bb", 2),
+    ],
+)
+def test_display_width(text: str, expected: int) -> None:
+    assert display_width(text) == expected
@@ -12,6 +12,8 @@ from cleo.ui.question import Question
 
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from cleo.io.buffered_io import BufferedIO
 
 
@@ -49,6 +51,20 @@ def test_ask_hidden_response(io: BufferedIO) -> None:
     assert io.fetch_error() == "What time is it? "
 
 
+def test_prompt_is_flushed_before_reading(
+    io: BufferedIO, mocker: MockerFixture
+) -> None:
+    question = Question("What time is it?", "2PM")
+    io.set_user_input("8AM\n")
+    flush = mocker.spy(io.error_output, "flush")
+    read_line = mocker.patch.object(
+        io.input, "read_line", side_effect=lambda *args, **kwargs: str(flush.call_count)
+    )
+
+    assert question.ask(io) == "1"
+    read_line.assert_called_once()
+
+
 def test_ask_and_validate(io: BufferedIO) -> None:
     error = "This is not a color!"
 
@@ -481,3 +481,29 @@ def test_style_for_side_effects(io: BufferedIO) -> None:
     output2 = io.fetch_output()
 
     assert output1 != output2
+
+
+def test_render_wide_characters(io: BufferedIO) -> None:
+    table = Table(io)
+    table.set_headers(["Language", "Greeting"])
+    table.set_rows(
+        [
+            ["English", "Hello"],
+            ["日本語", "<info>こんにちは</info>"],
+            ["Emoji", "👋"],
+        ]
+    )
+
+    table.render()
+
+    expected = """\
++----------+------------+
+| Language | Greeting   |
++----------+------------+
+| English  | Hello      |
+| 日本語   | こんにちは |
+| Emoji    | 👋         |
++----------+------------+
+"""
+
+    assert io.fetch_output() == expected